@@ -6,9 +6,11 @@ It includes tests for converting between data types, reading and writing secrets
 creating and reconstructing shares, and handling edge cases such as excessively long secrets.
 """
 
+from types import SimpleNamespace
 from typing import Any, Literal, Optional
 
 import importlib.metadata
+import os
 
 import pytest
 
@@ -24,9 +26,39 @@ from wolfsoftware.shamir_secret_sharing import (
     write_shares_to_files,
     create_actual_shares,
     reconstruct_secret,
+    create_packed_shares,
+    reconstruct_packed_secrets,
+    create_ida_shares,
+    reconstruct_ida_secret,
+    create_hybrid_shares,
+    reconstruct_hybrid_secret,
+    share_to_string,
+    string_to_share,
+    RandomnessProvider,
+    BufferedRandomness,
+    SeededRandomness,
+    ShareSet,
+    enroll_shares,
+    enroll_shares_batch,
+    consistency_weights,
+    verify_shares,
+    create_verifiable_shares,
+    FixedBaseTable,
+    verify_share,
+    verify_share_commitments,
+    validate_commitments,
+    create_sub_shares,
+    combine_sub_shares,
+    reshare,
+    reshare_batch,
     FIXED_LARGE_PRIME,
-    MAX_SECRET_LENGTH
+    MAX_SECRET_LENGTH,
+    PACKED_PRIME,
+    FELDMAN_ORDER
 )
+from wolfsoftware.shamir_secret_sharing.cli import setup_arg_parser, process_arguments
+from wolfsoftware.shamir_secret_sharing.constants import FELDMAN_PRIME, FELDMAN_GENERATOR
+from wolfsoftware.shamir_secret_sharing.reconstruct import reconstruct_shares
 
 
 def test_version() -> None:
@@ -217,3 +249,482 @@ def test_multi_line_secret() -> None:
     reconstructed_secret_bytes: Any = int_to_bytes(reconstructed_secret_int, original_length)
     reconstructed_secret: Any = bytes_to_string(reconstructed_secret_bytes)
     assert reconstructed_secret == secret  # nosec: B101
+
+
+def test_create_and_reconstruct_packed_shares() -> None:
+    """
+    Test the create_packed_shares and reconstruct_packed_secrets functions.
+
+    This test checks that several secrets packed into a single set of shares can all be reconstructed
+    from any threshold number of shares.
+    """
+    secrets: list[str] = ["alpha", "bravo-charlie", "delta"]
+    total_shares = 6
+    threshold = 5
+
+    shares: list[tuple[int, int]] = create_packed_shares(secrets, total_shares, threshold)
+    assert len(shares) == total_shares  # nosec: B101
+
+    prime: Any = PACKED_PRIME
+    for subset in (shares[:threshold], shares[1:]):
+        reconstructed_ints: list[int] = reconstruct_packed_secrets(subset, len(secrets), prime)
+        reconstructed: list[str] = [
+            int_to_string(value, len(string_to_bytes(secret))) for value, secret in zip(reconstructed_ints, secrets)
+        ]
+        assert reconstructed == secrets  # nosec: B101
+
+
+def test_packed_shares_threshold_too_low() -> None:
+    """
+    Test handling of a threshold that cannot hold all of the packed secrets.
+
+    This test checks that an appropriate error is raised when the threshold is not greater than the number of secrets.
+    """
+    with pytest.raises(ValueError, match="Threshold must be greater than the number of packed secrets."):
+        create_packed_shares(["one", "two", "three"], 5, 3)
+
+
+def test_packed_shares_stay_small(tmp_path) -> None:
+    """
+    Test that packed shares are canonical elements of the packed field.
+
+    This test checks that every share fits in the size of PACKED_PRIME whatever the secrets are, that the shares can be
+    written to files, and that secrets too large for the field are rejected.
+    """
+    secrets: list[str] = ["a", "zzzzzzzzzzzzzzzz", "a"]
+    shares: list[tuple[int, int]] = create_packed_shares(secrets, 6, 5)
+    assert all(0 <= value < PACKED_PRIME for _, value in shares)  # nosec: B101
+
+    write_shares_to_files(shares, output=False, directory=tmp_path)
+    read_shares: list = [read_share_from_file(tmp_path / f"share-{i}.txt") for i in range(1, 6)]
+    assert reconstruct_packed_secrets(read_shares, 3, PACKED_PRIME) == [string_to_int(secret) for secret in secrets]  # nosec: B101
+
+    with pytest.raises(ValueError, match="Secret is too long. Maximum length is 65 bytes."):
+        create_packed_shares(["x" * 66, "y"], 4, 3)
+
+
+def test_create_and_reconstruct_ida_shares() -> None:
+    """
+    Test the create_ida_shares and reconstruct_ida_secret functions.
+
+    This test checks that dispersed shares are roughly 1/threshold of the secret size and that any threshold
+    number of shares reconstruct the original data.
+    """
+    secret: bytes = bytes(range(256)) * 40
+    total_shares = 5
+    threshold = 3
+
+    shares: list = create_ida_shares(secret, total_shares, threshold)
+    assert len(shares) == total_shares  # nosec: B101
+    assert all(len(share[3]) < len(secret) // 2 for share in shares)  # nosec: B101
+
+    assert reconstruct_ida_secret(shares[:threshold]) == secret  # nosec: B101
+    assert reconstruct_ida_secret(shares[2:]) == secret  # nosec: B101
+
+    with pytest.raises(ValueError, match="At least 3 distinct shares are required to reconstruct the secret."):
+        reconstruct_ida_secret(shares[:2])
+
+
+def test_reconstruct_ida_rejects_damaged_shares() -> None:
+    """
+    Test that reconstruct_ida_secret raises rather than returning truncated data from damaged or mismatched shares.
+    """
+    secret: bytes = bytes(range(100))
+    shares: list = create_ida_shares(secret, 5, 3)
+
+    truncated: list = list(shares[:3])
+    truncated[1] = truncated[1][:3] + (truncated[1][3][:16],)
+    with pytest.raises(ValueError, match="Share payloads at x = 2 are not the expected 48 bytes."):
+        reconstruct_ida_secret(truncated)
+
+    mixed: list = shares[:2] + [create_ida_shares(secret + b"more", 5, 3)[2]]
+    with pytest.raises(ValueError, match="Shares disagree on the threshold or data length"):
+        reconstruct_ida_secret(mixed)
+
+    with pytest.raises(ValueError, match="At least one share is required to reconstruct the secret."):
+        reconstruct_ida_secret([])
+
+
+def test_create_and_reconstruct_hybrid_shares() -> None:
+    """
+    Test the create_hybrid_shares and reconstruct_hybrid_secret functions.
+
+    This test checks that hybrid shares survive a round trip through their text form and reconstruct the
+    original data, and that the payloads do not contain the plain secret.
+    """
+    secret: bytes = b"A much larger secret backup. " * 64
+    total_shares = 4
+    threshold = 2
+
+    shares: list = create_hybrid_shares(secret, total_shares, threshold)
+    assert all(b"larger secret" not in share[3] for share in shares)  # nosec: B101
+
+    parsed: list = [string_to_share(share_to_string(share)) for share in shares]
+    assert parsed == shares  # nosec: B101
+    assert reconstruct_hybrid_secret(parsed[1:3]) == secret  # nosec: B101
+
+
+def test_reconstruct_hybrid_shares_reports_errors(tmp_path, capsys) -> None:
+    """
+    Test that the CLI reports too few hybrid shares as an error instead of a traceback.
+    """
+    write_shares_to_files(create_hybrid_shares(b"hybrid secret", 4, 2), False, str(tmp_path))
+    capsys.readouterr()
+
+    config = SimpleNamespace(reconstruct=[str(tmp_path / "share-1.txt")], threshold=None, verify=False, commitments=None, output=True)
+    with pytest.raises(SystemExit) as excinfo:
+        reconstruct_shares(config)
+    assert excinfo.value.code == 1  # nosec: B101
+    assert "At least 2 distinct shares are required" in capsys.readouterr().out  # nosec: B101
+
+
+def test_hybrid_key_share_hides_key() -> None:
+    """
+    Test that a single hybrid key share does not narrow down the key.
+
+    This test recreates the key drawn by a seeded provider and checks that no key share lies close to it, as it would
+    if the key were shared with small coefficients.
+    """
+    key: int = bytes_to_int(SeededRandomness(7).randbytes(32))
+    shares: list = create_hybrid_shares(b"hidden", 5, 3, provider=SeededRandomness(7))
+    assert all(abs(share[4] - key) > 2**34 for share in shares)  # nosec: B101
+    assert reconstruct_hybrid_secret(shares[:3]) == b"hidden"  # nosec: B101
+
+
+def test_buffered_randomness() -> None:
+    """
+    Test the BufferedRandomness provider.
+
+    This test checks that values are drawn within the requested range and that successive reads from the
+    buffer do not repeat bytes.
+    """
+    provider = BufferedRandomness(buffer_size=64)
+    values: list[int] = provider.randbelow_many(10, 500)
+    assert all(0 <= value < 10 for value in values)  # nosec: B101
+    assert set(values) == set(range(10))  # nosec: B101
+
+    first: bytes = provider.randbytes(32)
+    second: bytes = provider.randbytes(32)
+    assert len(first) == len(second) == 32  # nosec: B101
+    assert first != second  # nosec: B101
+
+
+def test_randomness_provider_is_abstract() -> None:
+    """
+    Test that RandomnessProvider cannot be used without implementing randbytes.
+
+    This test checks that the base class is abstract rather than failing only when randomness is first requested.
+    """
+    with pytest.raises(TypeError):
+        RandomnessProvider()  # type: ignore[abstract]  # pylint: disable=abstract-class-instantiated
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="Requires os.fork")
+def test_buffered_randomness_after_fork() -> None:
+    """
+    Test that a forked child does not reuse the parent's buffered random bytes.
+
+    This test warms the default provider's buffer, forks, and checks that the parent and the child create
+    different coefficients for the same secret.
+    """
+    create_actual_shares("warm", 3, 3)
+
+    read_fd, write_fd = os.pipe()
+    pid: int = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.close(read_fd)
+        os.write(write_fd, repr(create_actual_shares("a", 3, 3)).encode('utf-8'))
+        os.close(write_fd)
+        os._exit(0)  # pylint: disable=protected-access
+
+    os.close(write_fd)
+    parent_shares: list = create_actual_shares("a", 3, 3)
+    with os.fdopen(read_fd, 'rb') as pipe:
+        child_shares: str = pipe.read().decode('utf-8')
+    os.waitpid(pid, 0)
+
+    assert child_shares  # nosec: B101
+    assert child_shares != repr(parent_shares)  # nosec: B101
+
+
+def test_seeded_randomness_is_reproducible() -> None:
+    """
+    Test the SeededRandomness provider.
+
+    This test checks that the same seed produces the same shares and that the shares still reconstruct the secret.
+    """
+    secret = "reproducible"  # nosec: B105
+    first: list[tuple[int, int]] = create_actual_shares(secret, 5, 3, provider=SeededRandomness(42))
+    second: list[tuple[int, int]] = create_actual_shares(secret, 5, 3, provider=SeededRandomness(42))
+    other: list[tuple[int, int]] = create_actual_shares(secret, 5, 3, provider=SeededRandomness(43))
+    assert first == second  # nosec: B101
+    assert first != other  # nosec: B101
+
+    reconstructed_secret_int: Any = reconstruct_secret(first[2:], FIXED_LARGE_PRIME)
+    assert int_to_string(reconstructed_secret_int, len(secret)) == secret  # nosec: B101
+
+
+def test_reconstruct_with_threshold() -> None:
+    """
+    Test threshold aware reconstruction with reconstruct_secret.
+
+    This test checks that passing every share with the threshold reconstructs the secret, that the surplus shares
+    are checked for consistency when requested, and that a tampered surplus share is reported by its x-value.
+    """
+    secret = "thresholdAware"  # nosec: B105
+    shares: list[tuple[int, int]] = create_actual_shares(secret, 6, 3)
+    prime: Any = FIXED_LARGE_PRIME
+
+    reconstructed_secret_int: Any = reconstruct_secret(shares, prime, threshold=3, verify=True)
+    assert int_to_string(reconstructed_secret_int, len(secret)) == secret  # nosec: B101
+
+    tampered: list[tuple[int, int]] = shares[:5] + [(shares[5][0], shares[5][1] + 1)]
+    assert int_to_string(reconstruct_secret(tampered, prime, threshold=3), len(secret)) == secret  # nosec: B101
+    with pytest.raises(ValueError, match="Shares are inconsistent at x = 6."):
+        reconstruct_secret(tampered, prime, threshold=3, verify=True)
+    with pytest.raises(ValueError, match="A threshold is required to verify the shares."):
+        reconstruct_secret(shares, prime, verify=True)
+
+
+def test_share_set(tmp_path) -> None:
+    """
+    Test the ShareSet container.
+
+    This test checks that a ShareSet holds the same shares as the legacy list form, exposes zero-copy views of the
+    share values, and is accepted by reconstruct_secret and write_shares_to_files.
+    """
+    secret = "compactShares"  # nosec: B105
+    shares: Any = create_actual_shares(secret, 5, 3, as_share_set=True)
+    assert isinstance(shares, ShareSet)  # nosec: B101
+    assert len(shares) == 5  # nosec: B101
+
+    legacy: list[tuple[int, int]] = shares.to_list()
+    assert ShareSet.from_shares(legacy) == shares  # nosec: B101
+    assert int.from_bytes(shares.value_bytes(2), 'big') == legacy[2][1]  # nosec: B101
+    assert shares.value_bytes(2).obj is shares[1:4].value_bytes(1).obj  # nosec: B101
+
+    reconstructed_secret_int: Any = reconstruct_secret(shares[2:], FIXED_LARGE_PRIME)
+    assert int_to_string(reconstructed_secret_int, len(secret)) == secret  # nosec: B101
+
+    write_shares_to_files(shares, output=False, directory=tmp_path)
+    assert read_share_from_file(tmp_path / "share-4.txt") == legacy[3]  # nosec: B101
+
+
+def test_enroll_shares() -> None:
+    """
+    Test the enroll_shares and enroll_shares_batch functions.
+
+    This test checks that shares issued for new x-values match the shares the original polynomial would have produced,
+    that they can be combined with existing shares to reconstruct each secret, and that x = 0 is refused.
+    """
+    secrets: list[str] = ["first-secret", "second-secret", "third-secret"]
+    prime: Any = FIXED_LARGE_PRIME
+    all_shares: list = [create_actual_shares(secret, 7, 3) for secret in secrets]
+
+    new_shares: list = enroll_shares(all_shares[0][:3], [6, 7], prime)
+    assert new_shares == all_shares[0][5:]  # nosec: B101
+
+    batches: list = enroll_shares_batch([shares[:5] for shares in all_shares], [6, 7], prime, threshold=3)
+    for secret, shares, issued in zip(secrets, all_shares, batches):
+        assert issued == shares[5:]  # nosec: B101
+        reconstructed_secret_int: Any = reconstruct_secret([shares[0]] + issued, prime)
+        assert int_to_string(reconstructed_secret_int, len(secret)) == secret  # nosec: B101
+
+    with pytest.raises(ValueError, match="Cannot issue a share at x = 0"):
+        enroll_shares(all_shares[0][:3], [0], prime)
+
+
+def test_verify_shares() -> None:
+    """
+    Test the verify_shares and consistency_weights functions.
+
+    This test checks that consistent shares pass, that precomputed weights can be reused for other secrets held at
+    the same x-values, and that tampered or conflicting shares are reported by their x-values.
+    """
+    prime: Any = FIXED_LARGE_PRIME
+    threshold = 3
+    first: list[tuple[int, int]] = create_actual_shares("first", 6, threshold)
+    second: list[tuple[int, int]] = create_actual_shares("second", 6, threshold)
+
+    weights: list = consistency_weights([x for x, _ in first], threshold, prime)
+    assert verify_shares(first, threshold, prime, weights) == (True, [])  # nosec: B101
+    assert verify_shares(second, threshold, prime, weights) == (True, [])  # nosec: B101
+    assert verify_shares(first[:threshold], threshold, prime) == (True, [])  # nosec: B101
+
+    tampered: list[tuple[int, int]] = list(first)
+    tampered[4] = (tampered[4][0], tampered[4][1] + 1)
+    assert verify_shares(tampered, threshold, prime, weights) == (False, [5])  # nosec: B101
+    assert verify_shares(first + [(2, first[1][1] + 1)], threshold, prime) == (False, [2])  # nosec: B101
+
+
+def test_verify_shares_blames_the_right_shares() -> None:
+    """
+    Test that verify_shares names the bad shares wherever they are.
+
+    This test checks that a tampered share with one of the smallest x-values is blamed rather than the good surplus
+    shares, that two bad shares are both found when enough shares are supplied, that nothing is blamed when too many
+    shares are bad to tell which, and that weights for the wrong number of shares are rejected.
+    """
+    prime: Any = FIXED_LARGE_PRIME
+    threshold = 3
+    shares: list[tuple[int, int]] = create_actual_shares("blame", 7, threshold)
+
+    tampered: list[tuple[int, int]] = [(shares[0][0], shares[0][1] + 1)] + shares[1:6]
+    assert verify_shares(tampered, threshold, prime) == (False, [1])  # nosec: B101
+    with pytest.raises(ValueError, match="Shares are inconsistent at x = 1."):
+        reconstruct_secret(tampered, prime, threshold=threshold, verify=True)
+
+    two_bad: list[tuple[int, int]] = list(shares)
+    two_bad[1] = (two_bad[1][0], two_bad[1][1] + 5)
+    two_bad[4] = (two_bad[4][0], two_bad[4][1] + 9)
+    assert verify_shares(two_bad, threshold, prime) == (False, [2, 5])  # nosec: B101
+
+    assert verify_shares(tampered[:4], threshold, prime) == (False, [])  # nosec: B101
+    with pytest.raises(ValueError, match="too many are bad to tell which"):
+        reconstruct_secret(tampered[:4], prime, threshold=threshold, verify=True)
+
+    with pytest.raises(ValueError, match="Expected 6 consistency weights"):
+        verify_shares(shares[:6], threshold, prime, consistency_weights([x for x, _ in shares], threshold, prime))
+
+
+def test_fixed_base_table() -> None:
+    """
+    Test the FixedBaseTable class.
+
+    This test checks that exponentiation with the precomputed table matches the built-in pow.
+    """
+    modulus = 1000003
+    table = FixedBaseTable(5, modulus, 64)
+    for exponent in (0, 1, 15, 16, 123456789, 2**64 - 1):
+        assert table.pow(exponent) == pow(5, exponent, modulus)  # nosec: B101
+
+
+def test_create_and_verify_verifiable_shares() -> None:
+    """
+    Test the create_verifiable_shares, verify_share and verify_share_commitments functions.
+
+    This test checks that every share verifies against its commitments on its own and in a batch, that a tampered
+    share is rejected and reported by its x-value, and that the shares still reconstruct the secret.
+    """
+    secret = "verifiableSecret"  # nosec: B105
+    shares, commitments = create_verifiable_shares(secret, 5, 3)
+    assert len(commitments) == 3  # nosec: B101
+    assert all(verify_share(share, commitments) for share in shares)  # nosec: B101
+    assert verify_share_commitments(shares, commitments) == (True, [])  # nosec: B101
+
+    tampered: list[tuple[int, int]] = list(shares)
+    tampered[1] = (tampered[1][0], tampered[1][1] + 1)
+    assert not verify_share(tampered[1], commitments)  # nosec: B101
+    assert verify_share_commitments(tampered, commitments) == (False, [2])  # nosec: B101
+
+    reconstructed_secret_int: Any = reconstruct_secret(shares[:3], FELDMAN_ORDER)
+    assert int_to_string(reconstructed_secret_int, len(secret)) == secret  # nosec: B101
+    assert all(0 <= share[1] < FELDMAN_ORDER for share in shares)  # nosec: B101
+
+    with pytest.raises(ValueError, match="Maximum length is 255 bytes"):
+        create_verifiable_shares("x" * 256, 5, 3)
+
+
+def test_commitments_outside_the_subgroup_are_rejected() -> None:
+    """
+    Test that commitments outside the order FELDMAN_ORDER subgroup are rejected before any share is checked.
+
+    Negating a commitment moves it out of the subgroup, which would otherwise make the reduced exponents meaningless
+    and let a bad share pass the batch check about half the time.
+    """
+    shares, commitments = create_verifiable_shares("verifiableSecret", 5, 3)
+    validate_commitments(commitments)
+
+    for bad in (-commitments[1] % FELDMAN_PRIME, 1, 0, FELDMAN_PRIME):
+        forged: list[int] = [commitments[0], bad, commitments[2]]
+        with pytest.raises(ValueError, match="Commitment 1 is not an element of the commitment group"):
+            verify_share(shares[0], forged)
+        with pytest.raises(ValueError, match="Commitment 1 is not an element of the commitment group"):
+            verify_share_commitments(shares, forged)
+
+
+def test_verifiable_coefficients_are_not_small() -> None:
+    """
+    Test that the committed coefficients are drawn from the whole group order.
+
+    Small coefficients would let anyone solve C_j = g**a_j for a_j by baby-step giant-step and then recover the secret
+    from a single share, so this test checks the coefficients behind the commitments are full size.
+    """
+    _, commitments = create_verifiable_shares("verifiableSecret", 5, 4, SeededRandomness(7))
+    coefficients: list[int] = SeededRandomness(7).randbelow_many(FELDMAN_ORDER, 3)
+
+    assert all(coefficient.bit_length() > 64 for coefficient in coefficients)  # nosec: B101
+    assert commitments[1:] == [pow(FELDMAN_GENERATOR, a, FELDMAN_PRIME) for a in coefficients]  # nosec: B101
+
+
+@pytest.mark.parametrize("mode", ["ida", "hybrid"])
+def test_verifiable_rejected_outside_shamir_mode(monkeypatch, mode: str) -> None:
+    """
+    Test that --verifiable is rejected rather than silently ignored for the dispersal modes.
+    """
+    monkeypatch.setattr('sys.argv', ['shamir-secret-sharing', '-c', 'secret', '-s', '5', '-t', '3', '-m', mode, '--verifiable'])
+    with pytest.raises(SystemExit) as excinfo:
+        process_arguments(setup_arg_parser())
+    assert excinfo.value.code == 1  # nosec: B101
+
+
+def test_reshare() -> None:
+    """
+    Test the reshare function and the party-level resharing steps.
+
+    This test checks that a secret reshared from a 3 of 5 committee to a 4 of 6 committee can be reconstructed from
+    the new shares alone, that fewer than the new threshold of shares do not reconstruct it, and that running the
+    party-level steps by hand gives shares on the same polynomial.
+    """
+    secret = "rotateCustodians"  # nosec: B105
+    prime: Any = FIXED_LARGE_PRIME
+    shares: list[tuple[int, int]] = create_actual_shares(secret, 5, 3)
+    new_xs: list[int] = [10, 11, 12, 13, 14, 15]
+
+    new_shares: list = reshare(shares, new_xs, 4, prime, threshold=3)
+    assert [x for x, _ in new_shares] == new_xs  # nosec: B101
+    assert int_to_string(reconstruct_secret(new_shares[2:], prime), len(secret)) == secret  # nosec: B101
+    assert reconstruct_secret(new_shares[:3], prime) != string_to_int(secret)  # nosec: B101
+
+    rows: list = [create_sub_shares(share, new_xs, 4, prime) for share in shares[1:4]]
+    manual: list = [
+        combine_sub_shares(new_x, [(share[0], row[j][1]) for share, row in zip(shares[1:4], rows)], prime) for j, new_x in enumerate(new_xs)
+    ]
+    assert int_to_string(reconstruct_secret(manual[:4], prime), len(secret)) == secret  # nosec: B101
+
+
+def test_reshare_batch() -> None:
+    """
+    Test the reshare_batch function.
+
+    This test checks that every secret in a batch can be reconstructed from its new shares.
+    """
+    secrets: list[str] = [f"batch-secret-{i}" for i in range(5)]
+    prime: Any = FIXED_LARGE_PRIME
+    batches: list = [create_actual_shares(secret, 4, 2) for secret in secrets]
+
+    new_batches: list = reshare_batch(batches, [1, 2, 3], 3, prime, threshold=2)
+    for secret, new_shares in zip(secrets, new_batches):
+        assert int_to_string(reconstruct_secret(new_shares, prime), len(secret)) == secret  # nosec: B101
+
+
+def test_reshared_shares_round_trip_through_files(tmp_path, capsys) -> None:
+    """
+    Test that reshared shares can be written to files, read back and reconstructed by the CLI.
+
+    Reshared values are reduced modulo FIXED_LARGE_PRIME, so they are far wider than the 4300 digit limit on decimal
+    conversion. This test checks they are written in hex, read back unchanged, and that the reconstructed secret is not
+    padded to the width of the share values.
+    """
+    secret = "roundTripSecret"  # nosec: B105
+    new_shares: list = reshare(create_actual_shares(secret, 3, 2), [1, 2, 3], 2, FIXED_LARGE_PRIME)
+    assert max(share[1].bit_length() for share in new_shares) > 14000  # nosec: B101
+
+    write_shares_to_files(new_shares, False, str(tmp_path))
+    share_files: list[str] = [str(tmp_path / f"share-{i}.txt") for i in range(1, 4)]
+    assert [read_share_from_file(share_file) for share_file in share_files] == new_shares  # nosec: B101
+    capsys.readouterr()
+
+    config = SimpleNamespace(reconstruct=share_files[:2], threshold=2, verify=False, commitments=None, output=True)
+    reconstruct_shares(config)
+    assert capsys.readouterr().out == f"Reconstructed secret: {secret}\n"  # nosec: B101
@@ -7,8 +7,8 @@ sets the package version, and defines the `__all__` list for public API exposure
 
 import importlib.metadata
 
-from .constants import FIXED_LARGE_PRIME, MAX_SECRET_LENGTH
-from .create import create_shares, create_actual_shares
+from .constants import FIXED_LARGE_PRIME, MAX_SECRET_LENGTH, PACKED_PRIME, FELDMAN_ORDER
+from .create import create_shares, create_actual_shares, create_verifiable_shares
 from .utils import (
     string_to_bytes,
     bytes_to_string,
@@ -18,9 +18,21 @@ from .utils import (
     int_to_string,
     read_secret_from_file,
     read_share_from_file,
+    read_commitments_from_file,
+    write_commitments_to_file,
+    share_to_string,
+    string_to_share,
     write_shares_to_files
 )
+from .maths import consistency_weights, verify_shares
 from .reconstruct import reconstruct_secret
+from .shareset import ShareSet
+from .verifiable import FixedBaseTable, create_commitments, validate_commitments, verify_share, verify_share_commitments
+from .enroll import enroll_shares, enroll_shares_batch
+from .reshare import create_sub_shares, combine_sub_shares, reshare, reshare_batch
+from .packed import create_packed_shares, reconstruct_packed_secrets
+from .randomness import RandomnessProvider, BufferedRandomness, SeededRandomness, get_default_provider, set_default_provider
+from .ida import create_ida_shares, reconstruct_ida_secret, create_hybrid_shares, reconstruct_hybrid_secret
 
 try:
     __version__ = importlib.metadata.version('wolfsoftware.shamir_secret_sharing')
@@ -36,10 +48,42 @@ __all__ = [
     'int_to_string',
     'read_secret_from_file',
     'read_share_from_file',
+    'read_commitments_from_file',
+    'write_commitments_to_file',
+    'share_to_string',
+    'string_to_share',
     'write_shares_to_files',
     'create_shares',
     'create_actual_shares',
+    'create_verifiable_shares',
+    'FixedBaseTable',
+    'create_commitments',
+    'validate_commitments',
+    'verify_share',
+    'verify_share_commitments',
     'reconstruct_secret',
+    'consistency_weights',
+    'verify_shares',
+    'ShareSet',
+    'enroll_shares',
+    'enroll_shares_batch',
+    'create_sub_shares',
+    'combine_sub_shares',
+    'reshare',
+    'reshare_batch',
+    'create_packed_shares',
+    'reconstruct_packed_secrets',
+    'create_ida_shares',
+    'reconstruct_ida_secret',
+    'create_hybrid_shares',
+    'reconstruct_hybrid_secret',
+    'RandomnessProvider',
+    'BufferedRandomness',
+    'SeededRandomness',
+    'get_default_provider',
+    'set_default_provider',
     'FIXED_LARGE_PRIME',
+    'PACKED_PRIME',
+    'FELDMAN_ORDER',
     'MAX_SECRET_LENGTH'
 ]
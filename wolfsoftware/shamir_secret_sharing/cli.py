@@ -45,6 +45,12 @@ def setup_arg_parser() -> argparse.ArgumentParser:
 
     optional.add_argument('-s', '--shares', type=int, help='Total number of shares to create')
     optional.add_argument('-t', '--threshold', type=int, help='Threshold number of shares needed to reconstruct the secret')
+    optional.add_argument('-v', '--verify', action='store_true', help='Check that surplus shares are consistent before reconstructing')
+    optional.add_argument('-m', '--mode', type=str, choices=['shamir', 'ida', 'hybrid'], default='shamir',
+                          help='How to split the secret: Shamir sharing, information dispersal with shares of 1/threshold the size, '
+                               'or dispersal of an encrypted secret with a Shamir shared key')
+    optional.add_argument('--verifiable', action='store_true', help='Also create Feldman commitments so each share can be verified on its own')
+    optional.add_argument('--commitments', type=str, help='File of Feldman commitments to check the shares against before reconstructing')
     optional.add_argument('-o', '--output', action='store_true', help='Output shares to screen instead of writing to files')
     optional.add_argument('-d', '--shares-directory', type=str, default='shares', help='Where to write the shares files.')
 
@@ -77,6 +83,18 @@ def process_arguments(parser: argparse.ArgumentParser) -> argparse.Namespace:
             print(error_message("Threshold must be less than or equal to the total number of shares"))
             sys.exit(0)
 
+    if args.verifiable and args.mode != 'shamir':
+        print(error_message("Verifiable shares can only be created in shamir mode"))
+        sys.exit(1)
+
+    if args.reconstruct and args.threshold:
+        if args.threshold < 1:
+            print(error_message("Threshold must be greater than 0"))
+            sys.exit(1)
+        if args.threshold > len(args.reconstruct):
+            print(error_message("Threshold must be less than or equal to the number of shares supplied"))
+            sys.exit(1)
+
     return args
 
 
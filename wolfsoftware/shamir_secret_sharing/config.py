@@ -29,6 +29,10 @@ def create_configuration_from_arguments(args: Namespace) -> SimpleNamespace:
     config.reconstruct = args.reconstruct
     config.shares = args.shares
     config.threshold = args.threshold
+    config.mode = args.mode
+    config.verify = args.verify
+    config.verifiable = args.verifiable
+    config.commitments = args.commitments
     config.output = args.output
     config.shares_directory = args.shares_directory
 
@@ -2,10 +2,45 @@
 Constants used in the Shamir's Secret Sharing implementation.
 
 This module defines constants that are used throughout the Shamir's Secret Sharing scheme,
-including a fixed large prime number and the maximum allowed length for a secret.
+including a fixed large prime number and the maximum allowed length for a secret, as well as the smaller field
+used by the information dispersal mode.
 """
 
 # A fixed large prime number (>32768-bit prime)
 FIXED_LARGE_PRIME = 2**32768 - 2**32704 + 2**7680 * ((2**32255 - 1) // 2**31) + 1
 
 MAX_SECRET_LENGTH = 4096  # Maximum length in bytes for a secret
+
+# The Mersenne prime 2**127 - 1 used by the information dispersal mode, and the number of secret bytes packed
+# into each field element (15 bytes always fit below the prime; each element is stored in 16 bytes)
+IDA_PRIME = 2**127 - 1
+IDA_CHUNK_BYTES = 15
+IDA_ELEMENT_BYTES = 16
+
+HYBRID_KEY_BYTES = 32  # Length in bytes of the random key used by the hybrid dispersal mode
+HYBRID_KEY_PRIME = 2**256 + 297  # The smallest prime above 2**256, the field in which the hybrid key is shared
+
+# The 2048-bit MODP group from RFC 3526 (group 14) used for Feldman commitments. The modulus is a safe prime and
+# the generator 2 generates the subgroup of prime order (FELDMAN_PRIME - 1) // 2
+FELDMAN_PRIME = int(
+    'FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74020BBEA63B139B22514A08798E3404DD'
+    'EF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED'
+    'EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF0598DA48361C55D39A69163FA8FD24CF5F'
+    '83655D23DCA3AD961C62F356208552BB9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B'
+    'E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF6955817183995497CEA956AE515D2261898FA0510'
+    '15728E5A8AACAA68FFFFFFFFFFFFFFFF', 16)
+FELDMAN_GENERATOR = 2
+FELDMAN_ORDER = (FELDMAN_PRIME - 1) // 2
+
+# Verifiable shares are taken modulo FELDMAN_ORDER, so secrets must fit below it
+MAX_VERIFIABLE_SECRET_LENGTH = (FELDMAN_ORDER.bit_length() - 1) // 8
+
+VERIFIABLE_SHARE_MARKER = 'feldman'  # Trailing field that marks a share file as a verifiable share
+
+# Share values wider than this are written in hex, since Python refuses to convert integers of more than 4300 decimal
+# digits (about 14,000 bits) to and from text, and values reduced modulo FIXED_LARGE_PRIME can be nearly 32,768 bits
+MAX_DECIMAL_SHARE_BITS = 4096
+
+# The Mersenne prime 2**521 - 1 used by default for packed sharing. It holds secrets of up to 65 bytes, and keeps each
+# share a fixed 66 bytes instead of the size of FIXED_LARGE_PRIME
+PACKED_PRIME = 2**521 - 1
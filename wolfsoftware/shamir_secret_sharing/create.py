@@ -1,28 +1,33 @@
 """
 Functions for creating shares from a secret using Shamir's Secret Sharing.
 
-This module provides functions to generate the actual shares from a secret and to create shares based on a given configuration.
+This module provides functions to generate the actual shares from a secret, optionally with Feldman commitments so each share can be
+verified, and to create shares based on a given configuration.
 """
 
 from types import SimpleNamespace
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
-from .constants import MAX_SECRET_LENGTH
+from .constants import MAX_SECRET_LENGTH, MAX_VERIFIABLE_SECRET_LENGTH, FELDMAN_ORDER, VERIFIABLE_SHARE_MARKER
+from .ida import create_ida_shares, create_hybrid_shares
 from .maths import generate_coefficients, polynomial
-from .utils import read_secret_from_file, write_shares_to_files, string_to_bytes, bytes_to_int
+from .randomness import RandomnessProvider
+from .shareset import ShareSet
+from .utils import read_secret_from_file, write_shares_to_files, write_commitments_to_file, string_to_bytes, bytes_to_int
+from .verifiable import create_commitments
 
 
-def create_actual_shares(secret: str, total_shares: int, threshold: int) -> list:
+def _secret_coefficients(secret: str, threshold: int, provider: Optional[RandomnessProvider] = None) -> list:
     """
-    Create the actual shares from a given secret using Shamir's Secret Sharing.
+    Generate the polynomial coefficients for a secret, checking that the secret fits the fixed prime.
 
     Arguments:
         secret (str): The secret to be shared.
-        total_shares (int): The total number of shares to create.
         threshold (int): The minimum number of shares required to reconstruct the secret.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
 
     Returns:
-        list: A list of tuples, each containing a share index and its corresponding value.
+        list: A list of coefficients for the polynomial.
     """
     secret_bytes: bytes = string_to_bytes(secret)
     secret_int: int = bytes_to_int(secret_bytes)
@@ -31,24 +36,82 @@ def create_actual_shares(secret: str, total_shares: int, threshold: int) -> list
     if len(secret_bytes) > MAX_SECRET_LENGTH:
         raise ValueError(f"Secret is too long. Maximum length is {MAX_SECRET_LENGTH} bytes.")
 
-    coefficients: List = generate_coefficients(secret_int, threshold)
+    return generate_coefficients(secret_int, threshold, provider)
+
+
+def create_actual_shares(secret: str, total_shares: int, threshold: int, provider: Optional[RandomnessProvider] = None,
+                         as_share_set: bool = False) -> Union[list, ShareSet]:
+    """
+    Create the actual shares from a given secret using Shamir's Secret Sharing.
+
+    Arguments:
+        secret (str): The secret to be shared.
+        total_shares (int): The total number of shares to create.
+        threshold (int): The minimum number of shares required to reconstruct the secret.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+        as_share_set (bool): Whether to return the shares as a compact ShareSet instead of a list.
+
+    Returns:
+        Union[list, ShareSet]: A list of tuples, each containing a share index and its corresponding value, or the
+                               equivalent ShareSet.
+    """
+    coefficients: List = _secret_coefficients(secret, threshold, provider)
     shares: List[Tuple[int, int]] = [(i, polynomial(i, coefficients)) for i in range(1, total_shares + 1)]
+    if as_share_set:
+        return ShareSet.from_shares(shares)
     return shares
 
 
+def create_verifiable_shares(secret: str, total_shares: int, threshold: int,
+                             provider: Optional[RandomnessProvider] = None) -> Tuple[list, List[int]]:
+    """
+    Create shares from a given secret together with Feldman commitments that let each share be verified.
+
+    Arguments:
+        secret (str): The secret to be shared.
+        total_shares (int): The total number of shares to create.
+        threshold (int): The minimum number of shares required to reconstruct the secret.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+
+    Returns:
+        Tuple[list, List[int]]: The list of (index, value) shares and the commitments to the polynomial coefficients. The
+                                shares are reduced modulo FELDMAN_ORDER, which is also the prime to reconstruct with.
+    """
+    secret_bytes: bytes = string_to_bytes(secret)
+
+    # The shares live in the field of the commitment group's order, so the secret has to fit below it
+    if len(secret_bytes) > MAX_VERIFIABLE_SECRET_LENGTH:
+        raise ValueError(f"Secret is too long for verifiable shares. Maximum length is {MAX_VERIFIABLE_SECRET_LENGTH} bytes.")
+
+    # Uniformly random coefficients modulo the group order; small ones would let anyone solve C_j = g**a_j
+    coefficients: List = generate_coefficients(bytes_to_int(secret_bytes), threshold, provider, FELDMAN_ORDER)
+    shares: List[Tuple[int, int]] = [(i, polynomial(i, coefficients) % FELDMAN_ORDER) for i in range(1, total_shares + 1)]
+    return shares, create_commitments(coefficients)
+
+
 def create_shares(config: SimpleNamespace) -> None:
     """
     Create shares based on the given configuration and write them to files or print them to the output.
 
     Arguments:
         config (SimpleNamespace): The configuration containing the secret, number of shares, threshold,
-                                  and output options.
+                                  sharing mode, verifiable option and output options.
     """
     if config.create.endswith('.txt'):
         secret: str = read_secret_from_file(config.create)
     else:
         secret = config.create
 
-    shares: List = create_actual_shares(secret, config.shares, config.threshold)
+    if config.mode == 'ida':
+        shares: List = create_ida_shares(string_to_bytes(secret), config.shares, config.threshold)
+    elif config.mode == 'hybrid':
+        shares = create_hybrid_shares(string_to_bytes(secret), config.shares, config.threshold)
+    elif config.verifiable:
+        shares, commitments = create_verifiable_shares(secret, config.shares, config.threshold)
+        write_commitments_to_file(commitments, config.output, config.shares_directory)
+        shares = [share + (config.threshold, VERIFIABLE_SHARE_MARKER) for share in shares]
+    else:
+        # Record the threshold alongside each share so reconstruction only needs to interpolate that many
+        shares = [share + (config.threshold,) for share in create_actual_shares(secret, config.shares, config.threshold)]
 
     write_shares_to_files(shares, config.output, config.shares_directory)
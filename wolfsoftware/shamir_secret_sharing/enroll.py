@@ -0,0 +1,80 @@
+"""
+Functions for issuing shares to new custodians without reconstructing the secret.
+
+Any threshold number of existing shares determine the sharing polynomial, so a share for a new index can be calculated
+directly as a weighted sum of those shares. The Lagrange weights only depend on the x-values involved, so they are
+calculated once and then reused for every secret held by the same custodians, turning enrollment for a batch of secrets
+into a weight-times-vector job. The secret itself is never formed in memory.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .maths import lagrange_weights, select_shares
+
+
+def enrollment_weights(xs: List[int], new_xs: List[int], prime: int) -> List[List[int]]:
+    """
+    Calculate the Lagrange weights that map shares held at xs to shares at each new x-value.
+
+    Arguments:
+        xs (List[int]): The x-values of the existing shares used for enrollment.
+        new_xs (List[int]): The x-values of the shares to issue.
+        prime (int): The prime number used in the sharing scheme.
+
+    Returns:
+        List[List[int]]: One row of weights per new x-value.
+    """
+    for x in new_xs:
+        if x == 0:
+            raise ValueError("Cannot issue a share at x = 0, as that would reveal the secret.")
+    return [lagrange_weights(x, xs, prime) for x in new_xs]
+
+
+def enroll_shares(shares: list, new_xs: List[int], prime: int, threshold: Optional[int] = None) -> list:
+    """
+    Issue shares at new x-values from existing shares of the same secret.
+
+    Arguments:
+        shares (list): The existing shares, each a tuple containing the share index and value, or a ShareSet.
+        new_xs (List[int]): The x-values of the shares to issue.
+        prime (int): The prime number used in the sharing scheme.
+        threshold (Optional[int]): The number of shares required to reconstruct the secret. If None, every supplied
+                                   share is used.
+
+    Returns:
+        list: A list of tuples, each containing a new share index and its corresponding value.
+    """
+    return enroll_shares_batch([shares], new_xs, prime, threshold)[0]
+
+
+def enroll_shares_batch(share_batches: List[list], new_xs: List[int], prime: int, threshold: Optional[int] = None) -> List[list]:
+    """
+    Issue shares at new x-values for many secrets at once.
+
+    The weights are calculated once for each distinct set of x-values in the batch, so when every secret is held by
+    the same custodians each further secret costs only len(new_xs) * threshold multiplications.
+
+    Arguments:
+        share_batches (List[list]): The existing shares for each secret.
+        new_xs (List[int]): The x-values of the shares to issue for every secret.
+        prime (int): The prime number used in the sharing scheme.
+        threshold (Optional[int]): The number of shares required to reconstruct each secret. If None, every supplied
+                                   share is used.
+
+    Returns:
+        List[list]: The new shares for each secret, in the same order as share_batches.
+    """
+    cache: Dict[Tuple[int, ...], List[List[int]]] = {}
+    results: List[list] = []
+
+    for shares in share_batches:
+        shares = list(shares)
+        selected: list = select_shares(shares, threshold if threshold is not None else len(shares))
+        xs: Tuple[int, ...] = tuple(share[0] for share in selected)
+        ys: List[int] = [share[1] for share in selected]
+
+        if xs not in cache:
+            cache[xs] = enrollment_weights(list(xs), new_xs, prime)
+
+        results.append([(x, sum(w * y for w, y in zip(weights, ys)) % prime) for x, weights in zip(new_xs, cache[xs])])
+    return results
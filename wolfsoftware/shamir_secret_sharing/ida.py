@@ -0,0 +1,186 @@
+"""
+Functions for splitting a secret with Rabin's information dispersal algorithm (IDA).
+
+Plain Shamir sharing makes every share at least as large as the secret. The dispersal mode instead cuts the secret into
+blocks of `threshold` field elements and stores a single element per block in each share, so every share is roughly
+1/threshold of the secret and any `threshold` shares rebuild it. Dispersal on its own offers no confidentiality, since
+each share leaks part of the data.
+
+The hybrid mode (Krawczyk's "secret sharing made short") restores confidentiality: the secret is encrypted with a random
+key, the ciphertext is dispersed, and only the short key is shared with Shamir's scheme over the field modulo
+HYBRID_KEY_PRIME, using uniformly random coefficients so a single key share reveals nothing about the key.
+
+Dispersal shares are tuples of (index, threshold, length, payload) and hybrid shares add the Shamir share of the key as a
+fifth field.
+"""
+
+import hashlib
+
+from typing import List, Optional, Tuple
+
+from .constants import IDA_PRIME, IDA_CHUNK_BYTES, IDA_ELEMENT_BYTES, HYBRID_KEY_BYTES, HYBRID_KEY_PRIME
+from .maths import generate_coefficients, polynomial, lagrange_interpolation, lagrange_weights, select_shares
+from .packed import packed_secret_points
+from .randomness import RandomnessProvider, get_default_provider
+from .utils import bytes_to_int, int_to_bytes
+
+
+def _split_into_blocks(data: bytes, threshold: int) -> List[List[int]]:
+    """
+    Split data into blocks of `threshold` field elements, zero padding the final block.
+
+    Arguments:
+        data (bytes): The data to split.
+        threshold (int): The number of field elements in each block.
+
+    Returns:
+        List[List[int]]: The blocks of field elements.
+    """
+    block_bytes: int = threshold * IDA_CHUNK_BYTES
+    padded: bytes = data + bytes(-len(data) % block_bytes)
+    elements: List[int] = [
+        bytes_to_int(padded[offset:offset + IDA_CHUNK_BYTES]) for offset in range(0, len(padded), IDA_CHUNK_BYTES)
+    ]
+    return [elements[offset:offset + threshold] for offset in range(0, len(elements), threshold)]
+
+
+def _stream_cipher(key: bytes, data: bytes) -> bytes:
+    """
+    Encrypt or decrypt data by XORing it with a SHAKE-256 keystream derived from the key.
+
+    Each key is random and used for a single secret, so no nonce is required.
+
+    Arguments:
+        key (bytes): The random key.
+        data (bytes): The data to encrypt or decrypt.
+
+    Returns:
+        bytes: The transformed data.
+    """
+    keystream: bytes = hashlib.shake_256(key).digest(len(data))
+    return int_to_bytes(bytes_to_int(data) ^ bytes_to_int(keystream), len(data))
+
+
+def create_ida_shares(secret: bytes, total_shares: int, threshold: int) -> list:
+    """
+    Disperse a secret into shares of roughly len(secret) / threshold bytes each.
+
+    Arguments:
+        secret (bytes): The data to be dispersed.
+        total_shares (int): The total number of shares to create.
+        threshold (int): The number of shares required to reconstruct the data.
+
+    Returns:
+        list: A list of tuples, each containing a share index, the threshold, the data length and the share payload.
+    """
+    if threshold < 1 or threshold > total_shares:
+        raise ValueError("Threshold must be between 1 and the total number of shares.")
+
+    blocks: List[List[int]] = _split_into_blocks(secret, threshold)
+    points: List[int] = packed_secret_points(threshold)
+
+    shares: List[Tuple[int, int, int, bytes]] = []
+    for i in range(1, total_shares + 1):
+        # The weights are shared by every block, so each block costs a single dot product
+        weights: List[int] = lagrange_weights(i, points, IDA_PRIME)
+        payload: bytes = b''.join(
+            int_to_bytes(sum(w * m for w, m in zip(weights, block)) % IDA_PRIME, IDA_ELEMENT_BYTES) for block in blocks
+        )
+        shares.append((i, threshold, len(secret), payload))
+    return shares
+
+
+def _check_dispersal_shares(shares: list) -> Tuple[int, int]:
+    """
+    Check that dispersal shares agree on their threshold and data length, and that every payload has the right size.
+
+    Arguments:
+        shares (list): The list of dispersal shares.
+
+    Returns:
+        Tuple[int, int]: The threshold and data length shared by every share.
+    """
+    if not shares:
+        raise ValueError("At least one share is required to reconstruct the secret.")
+
+    threshold: int = shares[0][1]
+    length: int = shares[0][2]
+    if threshold < 1 or length < 0:
+        raise ValueError("Shares have an invalid threshold or data length.")
+    if any(share[1] != threshold or share[2] != length for share in shares):
+        raise ValueError("Shares disagree on the threshold or data length, so they are not from the same secret.")
+
+    # Each payload holds one field element per block of threshold chunks
+    payload_length: int = -(-length // (threshold * IDA_CHUNK_BYTES)) * IDA_ELEMENT_BYTES
+    bad: List[int] = [share[0] for share in shares if len(share[3]) != payload_length]
+    if bad:
+        raise ValueError(f"Share payloads at x = {', '.join(map(str, bad))} are not the expected {payload_length} bytes.")
+    return threshold, length
+
+
+def reconstruct_ida_secret(shares: list) -> bytes:
+    """
+    Reconstruct dispersed data from any threshold number of shares.
+
+    Arguments:
+        shares (list): The list of dispersal shares, as returned by create_ida_shares.
+
+    Returns:
+        bytes: The reconstructed data.
+    """
+    threshold, length = _check_dispersal_shares(shares)
+
+    selected: list = select_shares(shares, threshold)
+    xs: List[int] = [share[0] for share in selected]
+    columns: List[List[int]] = [
+        [bytes_to_int(share[3][offset:offset + IDA_ELEMENT_BYTES]) for offset in range(0, len(share[3]), IDA_ELEMENT_BYTES)]
+        for share in selected
+    ]
+    all_weights: List[list] = [lagrange_weights(point, xs, IDA_PRIME) for point in packed_secret_points(threshold)]
+
+    chunks: List[bytes] = []
+    for values in zip(*columns):
+        for weights in all_weights:
+            chunks.append(int_to_bytes(sum(w * v for w, v in zip(weights, values)) % IDA_PRIME, IDA_CHUNK_BYTES))
+    return b''.join(chunks)[:length]
+
+
+def create_hybrid_shares(secret: bytes, total_shares: int, threshold: int, provider: Optional[RandomnessProvider] = None) -> list:
+    """
+    Disperse an encrypted copy of a secret and share its key with Shamir's scheme.
+
+    Arguments:
+        secret (bytes): The data to be shared.
+        total_shares (int): The total number of shares to create.
+        threshold (int): The number of shares required to reconstruct the data.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+
+    Returns:
+        list: A list of tuples, each containing a share index, the threshold, the data length, the share payload
+              and the share of the key.
+    """
+    if provider is None:
+        provider = get_default_provider()
+
+    key: bytes = provider.randbytes(HYBRID_KEY_BYTES)
+    ida_shares: list = create_ida_shares(_stream_cipher(key, secret), total_shares, threshold)
+
+    coefficients: List = generate_coefficients(bytes_to_int(key), threshold, provider, HYBRID_KEY_PRIME)
+    return [share + (polynomial(share[0], coefficients) % HYBRID_KEY_PRIME,) for share in ida_shares]
+
+
+def reconstruct_hybrid_secret(shares: list) -> bytes:
+    """
+    Reconstruct a secret from any threshold number of hybrid shares.
+
+    Arguments:
+        shares (list): The list of hybrid shares, as returned by create_hybrid_shares.
+
+    Returns:
+        bytes: The reconstructed data.
+    """
+    threshold, _ = _check_dispersal_shares(shares)
+    key_shares: List[Tuple[int, int]] = [(share[0], share[4]) for share in select_shares(shares, threshold)]
+    key: bytes = int_to_bytes(lagrange_interpolation(0, key_shares, HYBRID_KEY_PRIME), HYBRID_KEY_BYTES)
+
+    return _stream_cipher(key, reconstruct_ida_secret(shares))
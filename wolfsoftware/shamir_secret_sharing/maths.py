@@ -4,9 +4,11 @@ Mathematical functions for Shamir's Secret Sharing.
 This module provides utility functions for polynomial evaluations, coefficient generation, and Lagrange interpolation
 used in Shamir's Secret Sharing scheme.
 """
-from typing import List
-import random
-from functools import reduce
+from typing import List, Optional, Tuple
+
+from .randomness import RandomnessProvider, get_default_provider
+
+COEFFICIENT_UPPER_BOUND = 2**32 + 1  # Random coefficients are drawn uniformly from [0, 2**32]
 
 
 def polynomial(x: int, coefficients: list) -> int:
@@ -23,18 +25,24 @@ def polynomial(x: int, coefficients: list) -> int:
     return sum(coeff * x**i for i, coeff in enumerate(coefficients))
 
 
-def generate_coefficients(secret: int, threshold: int) -> list:
+def generate_coefficients(secret: int, threshold: int, provider: Optional[RandomnessProvider] = None, prime: Optional[int] = None) -> list:
     """
     Generate random coefficients for the polynomial, with the secret as the constant term.
 
     Arguments:
         secret (int): The secret to be shared, used as the constant term of the polynomial.
         threshold (int): The minimum number of shares required to reconstruct the secret.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+        prime (Optional[int]): If given, the coefficients are drawn uniformly from the whole field modulo this prime
+                               instead of from [0, 2**32].
 
     Returns:
         list: A list of coefficients for the polynomial.
     """
-    coefficients: List[int] = [secret] + [random.SystemRandom().randint(0, 2**32) for _ in range(threshold - 1)]
+    if provider is None:
+        provider = get_default_provider()
+    upper: int = prime if prime is not None else COEFFICIENT_UPPER_BOUND
+    coefficients: List[int] = [secret] + provider.randbelow_many(upper, threshold - 1)
     return coefficients
 
 
@@ -50,35 +58,281 @@ def lagrange_interpolation(x: int, shares: list, prime: int) -> int:
     Returns:
         int: The reconstructed secret as an integer.
     """
-    def _basis(j: int) -> int:
-        """
-        Calculate the Lagrange basis polynomial at index j.
+    # Decode the shares once, so containers that decode values on access (such as ShareSet) are not decoded per term
+    shares = list(shares)
+
+    # Sum up all the Lagrange basis polynomials multiplied by their corresponding y-values
+    weights: List[int] = lagrange_weights(x, [xj for xj, _ in shares], prime)
+    return sum(w * yj for w, (_, yj) in zip(weights, shares)) % prime
+
+
+def consistency_weights(xs: list, threshold: int, prime: int, provider: Optional[RandomnessProvider] = None) -> list:
+    """
+    Calculate the weights used to check that shares at the given x-values lie on one polynomial of degree threshold - 1.
+
+    Values at n points lie on such a polynomial exactly when they satisfy the n - threshold parity checks of the dual
+    code, sum(u_i * x_i**j * y_i) == 0 for j < n - threshold, where u_i = 1 / prod(x_i - x_m). The checks are folded
+    into one with a random challenge r, giving a single weight u_i * sum((r * x_i)**j) per share. A bad set of shares
+    passes with probability at most (n - threshold) / prime.
+
+    Arguments:
+        xs (list): The distinct x-values of the shares to check.
+        threshold (int): The number of shares required to reconstruct the secret.
+        prime (int): The prime number used in the sharing scheme.
+        provider (Optional[RandomnessProvider]): The source of the random challenge. If None, the default provider is used.
+
+    Returns:
+        list: One weight per x-value, in the same order.
+    """
+    checks: int = len(xs) - threshold
+    if checks <= 0:
+        return [0] * len(xs)
+
+    if provider is None:
+        provider = get_default_provider()
+    challenge: int = provider.randbelow(prime - 1) + 1
+
+    inverses: List[int] = inverse_denominators(xs, prime)
+
+    weights: List[int] = []
+    for xi, inverse in zip(xs, inverses):
+        term = 1
+        total = 0
+        step: int = challenge * xi % prime
+        for _ in range(checks):
+            total += term
+            term = term * step % prime
+
+        weights.append(total % prime * inverse % prime)
+    return weights
+
+
+def _solve_linear_system(rows: List[List[int]], prime: int) -> Optional[List[int]]:
+    """
+    Solve a linear system modulo a prime by Gaussian elimination, setting any free variables to zero.
 
-        Arguments:
-            j (int): The index of the basis polynomial.
+    Arguments:
+        rows (List[List[int]]): The augmented matrix, one row per equation with the constant as the last entry.
+        prime (int): The prime modulus.
 
-        Returns:
-            int: The value of the basis polynomial.
-        """
-        xj, _ = shares[j]
+    Returns:
+        Optional[List[int]]: A solution, or None if the system is inconsistent.
+    """
+    rows = [[value % prime for value in row] for row in rows]
+    unknowns: int = len(rows[0]) - 1
+    pivots: List[int] = []
+    rank = 0
+    for column in range(unknowns):
+        pivot: Optional[int] = next((r for r in range(rank, len(rows)) if rows[r][column]), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        inverse: int = pow(rows[rank][column], -1, prime)
+        rows[rank] = [value * inverse % prime for value in rows[rank]]
+        for r, row in enumerate(rows):
+            if r != rank and row[column]:
+                factor: int = row[column]
+                rows[r] = [(value - factor * pivot_value) % prime for value, pivot_value in zip(row, rows[rank])]
+        pivots.append(column)
+        rank += 1
 
-        def _product(m: int) -> int:
-            """
-            Calculate the product term for the basis polynomial.
+    if any(row[-1] for row in rows[rank:]):
+        return None
 
-            Arguments:
-                m (int): The current index in the product calculation.
+    solution: List[int] = [0] * unknowns
+    for r, column in enumerate(pivots):
+        solution[column] = rows[r][-1]
+    return solution
 
-            Returns:
-                int: The product term value.
-            """
-            xm, _ = shares[m]
+
+def _divide_polynomials(numerator: List[int], denominator: List[int], prime: int) -> Tuple[List[int], List[int]]:
+    """
+    Divide two polynomials modulo a prime, with coefficients listed from the constant term upwards.
+
+    Arguments:
+        numerator (List[int]): The coefficients of the dividend.
+        denominator (List[int]): The coefficients of the divisor, whose leading coefficient must be non-zero.
+        prime (int): The prime modulus.
+
+    Returns:
+        Tuple[List[int], List[int]]: The coefficients of the quotient and of the remainder.
+    """
+    remainder: List[int] = [value % prime for value in numerator]
+    degree: int = len(denominator) - 1
+    inverse_lead: int = pow(denominator[-1], -1, prime)
+    quotient: List[int] = [0] * max(len(remainder) - degree, 0)
+    for shift in range(len(quotient) - 1, -1, -1):
+        factor: int = remainder[shift + degree] * inverse_lead % prime
+        quotient[shift] = factor
+        for j, coefficient in enumerate(denominator):
+            remainder[shift + j] = (remainder[shift + j] - factor * coefficient) % prime
+    return quotient, remainder[:degree]
+
+
+def locate_bad_shares(shares: list, threshold: int, prime: int) -> Optional[List[int]]:
+    """
+    Identify the shares that do not lie on the sharing polynomial using Berlekamp-Welch decoding.
+
+    With n distinct shares, up to (n - threshold) // 2 bad shares can be identified without ambiguity, whichever
+    shares they are. Beyond that there is no unique answer, so nothing is blamed.
+
+    Arguments:
+        shares (list): The distinct shares, each a tuple containing the share index and value.
+        threshold (int): The number of shares required to reconstruct the secret.
+        prime (int): The prime number used in the sharing scheme.
+
+    Returns:
+        Optional[List[int]]: The x-values of the bad shares, or None if they cannot be identified.
+    """
+    errors: int = (len(shares) - threshold) // 2
+    if errors <= 0:
+        return None
+
+    # Solve Q(x_i) = y_i * E(x_i) for a monic error locator E of degree `errors` and Q of degree errors + threshold - 1
+    rows: List[List[int]] = [
+        [pow(x, j, prime) for j in range(errors + threshold)] + [-y * pow(x, j, prime) for j in range(errors)] + [y * pow(x, errors, prime)]
+        for x, y in shares
+    ]
+    solution: Optional[List[int]] = _solve_linear_system(rows, prime)
+    if solution is None:
+        return None
+
+    quotient, remainder = _divide_polynomials(solution[:errors + threshold], solution[errors + threshold:] + [1], prime)
+    if any(remainder):
+        return None
+
+    bad: List[int] = [x for x, y in shares if polynomial(x, quotient) % prime != y % prime]
+    return bad if len(bad) <= errors else None
+
+
+def verify_shares(shares: list, threshold: int, prime: int, weights: Optional[list] = None) -> Tuple[bool, List[int]]:
+    """
+    Check that all of the shares lie on the same polynomial of degree threshold - 1.
+
+    After the weights have been calculated the check is a single dot product over the shares, so it is much cheaper
+    than interpolating. Only when it fails are the offenders looked for with locate_bad_shares, which names them when
+    at most (n - threshold) // 2 of the n distinct shares are bad. Otherwise the offending shares cannot be told apart
+    from the good ones and only shares that conflict with another share at the same index are named.
+
+    Arguments:
+        shares (list): The list of shares, each a tuple containing the share index and value.
+        threshold (int): The number of shares required to reconstruct the secret.
+        prime (int): The prime number used in the sharing scheme.
+        weights (Optional[list]): Weights from consistency_weights for the distinct x-values of the shares, in the
+                                  order they first appear, so they can be reused across secrets held at the same x-values.
+
+    Returns:
+        Tuple[bool, List[int]]: Whether the shares are consistent, and the x-values of the offending shares that could
+                                be identified.
+    """
+    unique: dict = {}
+    conflicting: List[int] = []
+    for share in shares:
+        x, y = share[0], share[1]
+        if x in unique:
+            if (unique[x][1] - y) % prime:
+                conflicting.append(x)
+        else:
+            unique[x] = (x, y)
+    distinct: list = list(unique.values())
+
+    if weights is None:
+        weights = consistency_weights([x for x, _ in distinct], threshold, prime)
+    elif len(weights) != len(distinct):
+        raise ValueError(f"Expected {len(distinct)} consistency weights, one per distinct share index, but got {len(weights)}.")
+
+    if sum(w * y for w, (_, y) in zip(weights, distinct)) % prime == 0:
+        return not conflicting, sorted(set(conflicting))
+
+    offenders: Optional[List[int]] = locate_bad_shares(distinct, threshold, prime)
+    return False, sorted(set((offenders or []) + conflicting))
+
+
+def inverse_denominators(points: list, prime: int) -> list:
+    """
+    Calculate the inverted Lagrange denominators 1 / prod(x_j - x_m) for the given points.
+
+    The denominators only depend on the points, so they can be calculated once and reused to build the weights for any
+    number of evaluation points. All of them are inverted together with a single modular inverse.
+
+    Arguments:
+        points (list): The distinct x-values at which the known values are held.
+        prime (int): The prime number used in the sharing scheme.
+
+    Returns:
+        list: One inverted denominator per point.
+    """
+    denominators: List[int] = []
+    for j, xj in enumerate(points):
+        denominator = 1
+        for m, xm in enumerate(points):
             if m != j:
-                # Calculate the product term for Lagrange interpolation
-                return (x - xm) * pow(xj - xm, -1, prime) % prime
-            return 1
-        # Reduce the product over all shares to get the basis polynomial value
-        return reduce(lambda acc, m: acc * _product(m) % prime, range(len(shares)), 1)
+                denominator = denominator * (xj - xm) % prime
+        denominators.append(denominator)
 
-    # Sum up all the Lagrange basis polynomials multiplied by their corresponding y-values
-    return sum(yj * _basis(j) % prime for j, (xj, yj) in enumerate(shares)) % prime
+    # Montgomery's trick: invert the running product once, then peel off each inverse
+    prefixes: List[int] = []
+    running = 1
+    for denominator in denominators:
+        prefixes.append(running)
+        running = running * denominator % prime
+
+    inverse_running: int = pow(running, -1, prime)
+    inverses: List[int] = [0] * len(denominators)
+    for j in range(len(denominators) - 1, -1, -1):
+        inverses[j] = inverse_running * prefixes[j] % prime
+        inverse_running = inverse_running * denominators[j] % prime
+    return inverses
+
+
+def lagrange_weights(x: int, points: list, prime: int, inverses: Optional[list] = None) -> list:
+    """
+    Calculate the Lagrange basis weights for evaluating at x from values held at the given points.
+
+    The weights only depend on the points, so they can be computed once and reused for any number of value
+    vectors held at the same points, turning each further evaluation into a single dot product.
+
+    Arguments:
+        x (int): The point at which the interpolated polynomial will be evaluated.
+        points (list): The distinct x-values at which the known values are held.
+        prime (int): The prime number used in the sharing scheme.
+        inverses (Optional[list]): The result of inverse_denominators for the points, to avoid recalculating it.
+
+    Returns:
+        list: One weight per point, such that the sum of weight * value modulo prime is the polynomial value at x.
+    """
+    if inverses is None:
+        inverses = inverse_denominators(points, prime)
+
+    weights: List[int] = []
+    for j, inverse in enumerate(inverses):
+        numerator = 1
+        for m, xm in enumerate(points):
+            if m != j:
+                numerator = numerator * (x - xm) % prime
+        weights.append(numerator * inverse % prime)
+    return weights
+
+
+def select_shares(shares: list, threshold: int) -> list:
+    """
+    Select the minimal subset of shares needed for interpolation.
+
+    Duplicate share indexes are dropped and the shares with the smallest absolute x-values are preferred, since
+    they keep the interpolation numerators and denominators (and the unreduced share values) smallest.
+
+    Arguments:
+        shares (list): The list of shares, each a tuple starting with the share index.
+        threshold (int): The number of shares required to reconstruct the secret.
+
+    Returns:
+        list: The selected shares, in order of increasing absolute x-value.
+    """
+    unique: dict = {}
+    for share in shares:
+        unique.setdefault(share[0], share)
+
+    if len(unique) < threshold:
+        raise ValueError(f"At least {threshold} distinct shares are required to reconstruct the secret.")
+
+    return sorted(unique.values(), key=lambda share: abs(share[0]))[:threshold]
@@ -0,0 +1,111 @@
+"""
+Functions for packed (multi-secret) sharing using a Franklin-Yung style scheme.
+
+This module embeds several secrets at distinct evaluation points of a single polynomial, so that a batch of small
+secrets shared with the same committee needs only one set of shares instead of one set per secret.
+
+The threshold keeps its usual meaning: it is the number of shares needed to reconstruct the secrets. Packing
+`count` secrets into one polynomial of degree `threshold - 1` leaves `threshold - count` random degrees of
+freedom, so any `threshold - count` shares reveal nothing about the secrets, while `threshold` shares recover
+all of them.
+
+Shares are field elements modulo the sharing prime, which defaults to PACKED_PRIME so that shares of small secrets
+stay small. The same prime must be passed to reconstruct_packed_secrets.
+"""
+
+from typing import List, Optional
+
+from .constants import PACKED_PRIME
+from .maths import generate_coefficients, polynomial, inverse_denominators, lagrange_weights
+from .randomness import RandomnessProvider
+from .utils import string_to_bytes, bytes_to_int
+
+
+def packed_secret_points(count: int) -> List[int]:
+    """
+    Return the evaluation points at which the packed secrets are embedded.
+
+    The first secret is held at x = 0, matching plain Shamir sharing, and the remaining secrets are held at
+    x = -1, -2, ... so they never collide with the share indexes 1..n.
+
+    Arguments:
+        count (int): The number of packed secrets.
+
+    Returns:
+        List[int]: The evaluation points, one per secret.
+    """
+    return [-j for j in range(count)]
+
+
+def create_packed_shares(secrets: List[str], total_shares: int, threshold: int, provider: Optional[RandomnessProvider] = None,
+                         prime: int = PACKED_PRIME) -> list:
+    """
+    Create shares that carry several secrets at once using packed secret sharing.
+
+    Arguments:
+        secrets (List[str]): The secrets to be shared.
+        total_shares (int): The total number of shares to create.
+        threshold (int): The number of shares required to reconstruct the secrets. It must be greater than the
+                         number of secrets, and any `threshold - len(secrets)` shares reveal nothing.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+        prime (int): The prime number used in the sharing scheme. Every secret must be smaller than it.
+
+    Returns:
+        list: A list of tuples, each containing a share index and its corresponding value, reduced modulo the prime.
+    """
+    if not secrets:
+        raise ValueError("At least one secret is required.")
+
+    if threshold <= len(secrets):
+        raise ValueError("Threshold must be greater than the number of packed secrets.")
+
+    if threshold > total_shares:
+        raise ValueError("Threshold must be less than or equal to the total number of shares.")
+
+    secret_ints: List[int] = []
+    for secret in secrets:
+        secret_int: int = bytes_to_int(string_to_bytes(secret))
+        if secret_int >= prime:
+            raise ValueError(f"Secret is too long. Maximum length is {(prime.bit_length() - 1) // 8} bytes.")
+        secret_ints.append(secret_int)
+
+    points: List[int] = packed_secret_points(len(secret_ints))
+
+    # A uniformly random polynomial of degree threshold - 1 that already holds the first secret at x = 0
+    coefficients: List = generate_coefficients(secret_ints[0], threshold, provider, prime)
+
+    # Correct the remaining secret points with a low degree polynomial that vanishes at x = 0, so the sum
+    # takes the right value at every secret point while keeping the random high order terms intact
+    corrections: List[int] = [0] + [(secret_int - polynomial(point, coefficients)) % prime for point, secret_int in zip(points[1:], secret_ints[1:])]
+
+    # The correction points are fixed, so their denominators are inverted once for every share
+    inverses: List[int] = inverse_denominators(points, prime)
+
+    return [
+        (i, (polynomial(i, coefficients) + sum(w * c for w, c in zip(lagrange_weights(i, points, prime, inverses), corrections))) % prime)
+        for i in range(1, total_shares + 1)
+    ]
+
+
+def reconstruct_packed_secrets(shares: list, count: int, prime: int) -> List[int]:
+    """
+    Reconstruct the packed secret integers from the given shares using Lagrange interpolation.
+
+    Arguments:
+        shares (list): The list of shares, each a tuple containing the share index and value. At least the
+                       threshold number of shares must be supplied.
+        count (int): The number of secrets packed into the shares.
+        prime (int): The prime number used in the sharing scheme.
+
+    Returns:
+        List[int]: The reconstructed secrets as integers, in the order they were shared.
+    """
+    shares = list(shares)
+    xs: List[int] = [share[0] for share in shares]
+
+    # The denominators only depend on the share indexes, so they are inverted once for all of the secrets
+    inverses: List[int] = inverse_denominators(xs, prime)
+    return [
+        sum(w * share[1] for w, share in zip(lagrange_weights(point, xs, prime, inverses), shares)) % prime
+        for point in packed_secret_points(count)
+    ]
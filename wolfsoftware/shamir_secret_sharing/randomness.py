@@ -0,0 +1,234 @@
+"""
+Sources of randomness for generating polynomial coefficients and keys.
+
+This module defines a small provider interface so callers can choose where random values come from. The default
+provider reads large blocks from os.urandom into a buffer and slices uniformly distributed values out of it by
+rejection sampling, which avoids a system call per coefficient. A seeded provider produces a reproducible stream
+for benchmarks and tests and must never be used to protect real secrets.
+
+Buffered providers drop their buffer in a forked child, so parent and child never hand out the same bytes.
+"""
+
+import hashlib
+import os
+import threading
+import weakref
+
+from abc import ABC, abstractmethod
+
+from typing import List, Optional, Union
+
+DEFAULT_BUFFER_SIZE = 65536  # Number of random bytes fetched from the operating system at a time
+
+
+class RandomnessProvider(ABC):
+    """
+    Base class for randomness providers.
+
+    Subclasses only need to implement randbytes; the integer helpers are built on top of it.
+    """
+
+    @abstractmethod
+    def randbytes(self, n: int) -> bytes:
+        """
+        Return n random bytes.
+
+        Arguments:
+            n (int): The number of bytes to return.
+
+        Returns:
+            bytes: The random bytes.
+        """
+
+    def randbelow_many(self, upper: int, count: int) -> List[int]:
+        """
+        Return count integers drawn uniformly from the range [0, upper).
+
+        Each candidate is taken from the random byte stream, masked to the bit length of upper - 1 and rejected
+        if it is out of range, so the result has no modulo bias.
+
+        Arguments:
+            upper (int): The exclusive upper bound, which must be positive.
+            count (int): The number of integers to return.
+
+        Returns:
+            List[int]: The random integers.
+        """
+        if upper <= 0:
+            raise ValueError("Upper bound must be positive.")
+
+        bits: int = (upper - 1).bit_length()
+        width: int = max((bits + 7) // 8, 1)
+        mask: int = (1 << bits) - 1
+
+        values: List[int] = []
+        while len(values) < count:
+            # Draw enough candidates for the expected acceptance rate (at least one half) in a single read
+            needed: int = 2 * (count - len(values))
+            block: bytes = self.randbytes(needed * width)
+            for offset in range(0, len(block), width):
+                candidate: int = int.from_bytes(block[offset:offset + width], 'big') & mask
+                if candidate < upper:
+                    values.append(candidate)
+                    if len(values) == count:
+                        break
+        return values
+
+    def randbelow(self, upper: int) -> int:
+        """
+        Return an integer drawn uniformly from the range [0, upper).
+
+        Arguments:
+            upper (int): The exclusive upper bound, which must be positive.
+
+        Returns:
+            int: The random integer.
+        """
+        return self.randbelow_many(upper, 1)[0]
+
+
+class BufferedRandomness(RandomnessProvider):
+    """
+    Cryptographically secure provider that serves bytes from a buffer refilled with large os.urandom reads.
+
+    Arguments:
+        buffer_size (int): The number of bytes fetched from the operating system per refill.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """
+        Initialise the provider with an empty buffer.
+
+        Arguments:
+            buffer_size (int): The number of bytes fetched from the operating system per refill.
+        """
+        self.buffer_size: int = buffer_size
+        self._buffer: bytes = b''
+        self._offset: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        _buffered_providers.add(self)
+
+    def _after_fork(self) -> None:
+        """
+        Discard the buffered bytes in a forked child, so it does not reuse bytes the parent will also hand out.
+
+        The lock is replaced as well, since another thread may have held it at the moment of the fork.
+        """
+        self._lock = threading.Lock()
+        self._buffer = b''
+        self._offset = 0
+
+    def _fill(self, n: int) -> bytes:
+        """
+        Fetch n fresh random bytes from the underlying source.
+
+        Arguments:
+            n (int): The number of bytes to fetch.
+
+        Returns:
+            bytes: The random bytes.
+        """
+        return os.urandom(n)
+
+    def randbytes(self, n: int) -> bytes:
+        """
+        Return n random bytes, refilling the buffer when it runs low.
+
+        Bytes are consumed exactly once, and the lock makes sure two threads never receive the same bytes.
+
+        Arguments:
+            n (int): The number of bytes to return.
+
+        Returns:
+            bytes: The random bytes.
+        """
+        with self._lock:
+            available: int = len(self._buffer) - self._offset
+            if available < n:
+                self._buffer = self._buffer[self._offset:] + self._fill(max(self.buffer_size, n - available))
+                self._offset = 0
+            result: bytes = self._buffer[self._offset:self._offset + n]
+            self._offset += n
+            return result
+
+
+class SeededRandomness(BufferedRandomness):
+    """
+    Deterministic provider that expands a seed with SHAKE-256 in counter mode.
+
+    The same seed always yields the same stream, which makes benchmarks and tests reproducible. It is not suitable
+    for protecting real secrets.
+
+    Arguments:
+        seed (Union[int, bytes, str]): The seed for the stream.
+        buffer_size (int): The number of bytes generated per refill.
+    """
+
+    def __init__(self, seed: Union[int, bytes, str], buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """
+        Initialise the provider from a seed.
+
+        Arguments:
+            seed (Union[int, bytes, str]): The seed for the stream.
+            buffer_size (int): The number of bytes generated per refill.
+        """
+        super().__init__(buffer_size)
+        if isinstance(seed, int):
+            seed = seed.to_bytes((seed.bit_length() + 8) // 8, 'big', signed=True)
+        elif isinstance(seed, str):
+            seed = seed.encode('utf-8')
+        self._seed: bytes = seed
+        self._counter: int = 0
+
+    def _after_fork(self) -> None:
+        """Replace the lock in a forked child, keeping the buffer so the seeded stream stays reproducible."""
+        self._lock = threading.Lock()
+
+    def _fill(self, n: int) -> bytes:
+        """
+        Generate the next n bytes of the seeded stream.
+
+        Arguments:
+            n (int): The number of bytes to generate.
+
+        Returns:
+            bytes: The generated bytes.
+        """
+        block: bytes = hashlib.shake_256(self._seed + self._counter.to_bytes(8, 'big')).digest(n)
+        self._counter += 1
+        return block
+
+
+def _reset_buffers_after_fork() -> None:
+    """Reset every live buffered provider in a freshly forked child process."""
+    for provider in list(_buffered_providers):
+        provider._after_fork()  # pylint: disable=protected-access
+
+
+_buffered_providers: 'weakref.WeakSet[BufferedRandomness]' = weakref.WeakSet()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_buffers_after_fork)
+
+_default_provider: RandomnessProvider = BufferedRandomness()
+
+
+def get_default_provider() -> RandomnessProvider:
+    """
+    Return the provider used when no provider is passed explicitly.
+
+    Returns:
+        RandomnessProvider: The default provider.
+    """
+    return _default_provider
+
+
+def set_default_provider(provider: Optional[RandomnessProvider] = None) -> None:
+    """
+    Replace the provider used when no provider is passed explicitly.
+
+    Arguments:
+        provider (Optional[RandomnessProvider]): The new default provider. If None, a fresh BufferedRandomness is used.
+    """
+    global _default_provider
+    _default_provider = provider if provider is not None else BufferedRandomness()
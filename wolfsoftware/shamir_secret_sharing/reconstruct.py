@@ -4,47 +4,106 @@ Functions for reconstructing a secret from shares using Shamir's Secret Sharing.
 This module provides functions to reconstruct the original secret from given shares and a configuration.
 """
 
+import sys
+
 from types import SimpleNamespace
 
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
+
+from wolfsoftware.notify import error_message
 
-from .constants import FIXED_LARGE_PRIME
-from .maths import lagrange_interpolation
-from .utils import read_share_from_file, int_to_bytes, bytes_to_string
+from .constants import FIXED_LARGE_PRIME, FELDMAN_ORDER, VERIFIABLE_SHARE_MARKER
+from .ida import reconstruct_ida_secret, reconstruct_hybrid_secret
+from .maths import lagrange_interpolation, select_shares, verify_shares
+from .utils import read_share_from_file, read_commitments_from_file, int_to_bytes, bytes_to_string
+from .verifiable import verify_share_commitments
 
 
-def reconstruct_secret(shares: list, prime: int) -> int:
+def reconstruct_secret(shares: list, prime: int, threshold: Optional[int] = None, verify: bool = False) -> int:
     """
     Reconstruct the secret integer from the given shares using Lagrange interpolation.
 
+    When the threshold is known only that many shares are interpolated, so passing every share costs no more than
+    passing the minimum. The surplus shares are then only used for the optional consistency check.
+
     Arguments:
-        shares (list): The list of shares, each a tuple containing the share index and value.
+        shares (Union[list, ShareSet]): The shares, as a list of (index, value) tuples or a ShareSet.
         prime (int): The prime number used in the sharing scheme.
+        threshold (Optional[int]): The number of shares required to reconstruct the secret. If None, every share is used.
+        verify (bool): Whether to check that the surplus shares are consistent with the selected ones. This needs the
+                       threshold.
 
     Returns:
         int: The reconstructed secret as an integer.
     """
+    if verify and threshold is None:
+        raise ValueError("A threshold is required to verify the shares.")
+
+    if threshold is not None:
+        if verify:
+            consistent, inconsistent = verify_shares(shares, threshold, prime)
+            if not consistent:
+                if inconsistent:
+                    raise ValueError(f"Shares are inconsistent at x = {', '.join(map(str, inconsistent))}.")
+                raise ValueError("Shares are inconsistent, but too many are bad to tell which.")
+        shares = select_shares(shares, threshold)
+
     secret_int: int = lagrange_interpolation(0, shares, prime)
     return secret_int
 
 
+def _reconstruct_shamir_shares(shares: List[Tuple], config: SimpleNamespace) -> bytes:
+    """
+    Reconstruct the secret bytes from Shamir shares read by the CLI, checking them against any commitments first.
+
+    Arguments:
+        shares (List[Tuple]): The shares read from the share files.
+        config (SimpleNamespace): The configuration containing the optional threshold, verify flag and commitments file.
+
+    Returns:
+        bytes: The reconstructed secret.
+    """
+    # Verifiable shares are taken modulo the order of the commitment group
+    prime: Any = FELDMAN_ORDER if shares[0][-1] == VERIFIABLE_SHARE_MARKER else FIXED_LARGE_PRIME
+
+    # Shamir shares written by the CLI carry the threshold as a third field
+    threshold: Optional[int] = config.threshold or next((share[2] for share in shares if len(share) > 2), None)
+    shares = [(share[0], share[1]) for share in shares]
+
+    if config.commitments:
+        valid, invalid = verify_share_commitments(shares, read_commitments_from_file(config.commitments))
+        if not valid:
+            raise ValueError(f"Shares do not match the commitments at x = {', '.join(map(str, invalid))}.")
+
+    secret_int: int = reconstruct_secret(shares, prime, threshold, config.verify)
+
+    # The length comes from the secret itself, since reduced share values are as wide as the prime
+    return int_to_bytes(secret_int, (secret_int.bit_length() + 7) // 8)
+
+
 def reconstruct_shares(config: SimpleNamespace) -> None:
     """
     Reconstruct the secret from the given shares based on the configuration and either print it or write it to a file.
 
     Arguments:
-        config (SimpleNamespace): The configuration containing the list of share files and output options.
+        config (SimpleNamespace): The configuration containing the list of share files, the optional threshold
+                                  and output options.
     """
     shares: List[Tuple] = [read_share_from_file(share_file) for share_file in config.reconstruct]
 
-    prime: Any = FIXED_LARGE_PRIME
-
-    # Calculate the maximum length of the shares
-    max_share_value: Any = max(share[1] for share in shares)
-    original_length: Any = (max_share_value.bit_length() + 7) // 8
+    # The share layout tells us which mode created it: (x, y) for Shamir, a trailing marker for verifiable shares, four
+    # fields for dispersal and five for hybrid
+    try:
+        if len(shares[0]) == 5:
+            secret_bytes: bytes = reconstruct_hybrid_secret(shares)
+        elif len(shares[0]) == 4 and shares[0][-1] != VERIFIABLE_SHARE_MARKER:
+            secret_bytes = reconstruct_ida_secret(shares)
+        else:
+            secret_bytes = _reconstruct_shamir_shares(shares, config)
+    except ValueError as err:
+        print(error_message(str(err)))
+        sys.exit(1)
 
-    secret_int: int = reconstruct_secret(shares, prime)
-    secret_bytes: bytes = int_to_bytes(secret_int, original_length)
     reconstructed_secret: str = bytes_to_string(secret_bytes)
 
     if config.output:
@@ -0,0 +1,125 @@
+"""
+Functions for resharing a secret to a new committee without reconstructing it.
+
+Each of a threshold number of current holders shares their own share with a fresh random polynomial of the new
+threshold, sending one sub-share to every new holder. Each new holder then combines the sub-shares they receive with
+the Lagrange weights of the old holders at x = 0. The combined values lie on a polynomial of the new threshold whose
+constant term is still the secret, yet the secret never exists in one place.
+
+The party-level steps (create_sub_shares and combine_sub_shares) can be run by separate custodians, while reshare and
+reshare_batch run the whole protocol in-process with simulated parties. Because the old holders' weights only depend on
+their x-values, a batch of secrets held by the same custodians reuses them for every secret.
+
+Reshared share values are reduced modulo the prime, so they are as large as the prime regardless of the secret size.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .maths import generate_coefficients, lagrange_weights, polynomial, select_shares
+from .randomness import RandomnessProvider
+
+
+def create_sub_shares(share: tuple, new_xs: List[int], new_threshold: int, prime: int,
+                      provider: Optional[RandomnessProvider] = None) -> List[Tuple[int, int]]:
+    """
+    Share an existing share with the new committee, as done by one current holder.
+
+    Arguments:
+        share (tuple): The holder's share, a tuple containing the share index and value.
+        new_xs (List[int]): The x-values of the new holders.
+        new_threshold (int): The number of new shares required to reconstruct the secret.
+        prime (int): The prime number used in the sharing scheme.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+
+    Returns:
+        List[Tuple[int, int]]: One sub-share per new holder, each a tuple of the new x-value and the sub-share value.
+    """
+    if new_threshold > len(new_xs):
+        raise ValueError("Threshold must be less than or equal to the total number of shares.")
+    if 0 in new_xs:
+        raise ValueError("Cannot issue a share at x = 0, as that would reveal the secret.")
+
+    coefficients: List = generate_coefficients(share[1] % prime, new_threshold, provider, prime)
+    return [(x, polynomial(x, coefficients) % prime) for x in new_xs]
+
+
+def combine_sub_shares(new_x: int, received: List[Tuple[int, int]], prime: int, weights: Optional[list] = None) -> Tuple[int, int]:
+    """
+    Combine the sub-shares received from the current holders into a new share, as done by one new holder.
+
+    Arguments:
+        new_x (int): The x-value of the new holder.
+        received (List[Tuple[int, int]]): The sub-shares received, each a tuple of the sending holder's x-value and the
+                                          sub-share value.
+        prime (int): The prime number used in the sharing scheme.
+        weights (Optional[list]): The Lagrange weights at x = 0 for the senders' x-values, in the same order. If None,
+                                  they are calculated from the received sub-shares.
+
+    Returns:
+        Tuple[int, int]: The new share, a tuple containing the new share index and value.
+    """
+    if weights is None:
+        weights = lagrange_weights(0, [old_x for old_x, _ in received], prime)
+    return new_x, sum(w * value for w, (_, value) in zip(weights, received)) % prime
+
+
+# pylint: disable-next=too-many-arguments  # the optional threshold and provider are keyword-only
+def reshare(shares: list, new_xs: List[int], new_threshold: int, prime: int, *, threshold: Optional[int] = None,
+            provider: Optional[RandomnessProvider] = None) -> list:
+    """
+    Reshare a secret to a new committee, simulating every party in-process.
+
+    Arguments:
+        shares (list): The current shares, each a tuple containing the share index and value, or a ShareSet.
+        new_xs (List[int]): The x-values of the new holders.
+        new_threshold (int): The number of new shares required to reconstruct the secret.
+        prime (int): The prime number used in the sharing scheme.
+        threshold (Optional[int]): The number of current shares required to reconstruct the secret. If None, every
+                                   supplied share is used.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+
+    Returns:
+        list: The new shares, each a tuple containing the new share index and value.
+    """
+    return reshare_batch([shares], new_xs, new_threshold, prime, threshold=threshold, provider=provider)[0]
+
+
+# pylint: disable-next=too-many-arguments  # the optional threshold and provider are keyword-only
+def reshare_batch(share_batches: List[list], new_xs: List[int], new_threshold: int, prime: int, *, threshold: Optional[int] = None,
+                  provider: Optional[RandomnessProvider] = None) -> List[list]:
+    """
+    Reshare many secrets to a new committee at once, simulating every party in-process.
+
+    The old holders' weights are calculated once for each distinct set of x-values in the batch, so rotating a
+    committee that holds thousands of secrets costs one set of weights plus the sub-sharing work per secret.
+
+    Arguments:
+        share_batches (List[list]): The current shares for each secret.
+        new_xs (List[int]): The x-values of the new holders.
+        new_threshold (int): The number of new shares required to reconstruct each secret.
+        prime (int): The prime number used in the sharing scheme.
+        threshold (Optional[int]): The number of current shares required to reconstruct each secret. If None, every
+                                   supplied share is used.
+        provider (Optional[RandomnessProvider]): The source of randomness. If None, the default provider is used.
+
+    Returns:
+        List[list]: The new shares for each secret, in the same order as share_batches.
+    """
+    cache: Dict[Tuple[int, ...], List[int]] = {}
+    results: List[list] = []
+
+    for shares in share_batches:
+        shares = list(shares)
+        selected: list = select_shares(shares, threshold if threshold is not None else len(shares))
+        old_xs: Tuple[int, ...] = tuple(share[0] for share in selected)
+
+        if old_xs not in cache:
+            cache[old_xs] = lagrange_weights(0, list(old_xs), prime)
+
+        # Row i holds the sub-shares sent by old holder i; column j is what new holder j receives
+        sub_shares: List[List[Tuple[int, int]]] = [create_sub_shares(share, new_xs, new_threshold, prime, provider) for share in selected]
+        results.append([
+            combine_sub_shares(new_x, [(old_x, row[j][1]) for old_x, row in zip(old_xs, sub_shares)], prime, cache[old_xs])
+            for j, new_x in enumerate(new_xs)
+        ])
+    return results
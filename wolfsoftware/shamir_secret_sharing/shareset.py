@@ -0,0 +1,154 @@
+"""
+A compact container for Shamir shares.
+
+Shares are normally passed around as lists of (index, value) tuples, which costs a tuple and a large integer object per
+share. The ShareSet class stores the indexes in an unsigned short array and the values as one contiguous buffer of
+fixed width big-endian integers, and hands out zero-copy memoryview slices of each value. It behaves like a sequence of
+(index, value) tuples, so it can be passed anywhere a list of shares is accepted.
+"""
+
+from array import array
+from typing import Iterator, List, Tuple, Union
+
+MAX_SHARE_INDEX = 65535  # The largest share index that fits in an array('H')
+
+
+class ShareSet:
+    """
+    A compact, array-backed set of Shamir shares.
+
+    Arguments:
+        xs (array): The share indexes, stored as array('H').
+        values (Union[bytes, memoryview]): The share values, concatenated as fixed width big-endian integers.
+        width (int): The width in bytes of each share value.
+    """
+
+    __slots__ = ('xs', 'width', '_values')
+
+    def __init__(self, xs: array, values: Union[bytes, memoryview], width: int) -> None:
+        """
+        Initialise the share set from its indexes and value buffer.
+
+        Arguments:
+            xs (array): The share indexes, stored as array('H').
+            values (Union[bytes, memoryview]): The share values, concatenated as fixed width big-endian integers.
+            width (int): The width in bytes of each share value.
+        """
+        if len(values) != len(xs) * width:
+            raise ValueError("Share value buffer does not match the number of shares and value width.")
+
+        self.xs: array = xs
+        self.width: int = width
+        self._values: memoryview = memoryview(values)
+
+    @classmethod
+    def from_shares(cls, shares: list) -> 'ShareSet':
+        """
+        Build a share set from a list of (index, value) tuples.
+
+        Arguments:
+            shares (list): The list of shares, each a tuple containing the share index and value.
+
+        Returns:
+            ShareSet: The compact share set.
+        """
+        if isinstance(shares, ShareSet):
+            return shares
+
+        xs: array = array('H')
+        for share in shares:
+            if not 0 <= share[0] <= MAX_SHARE_INDEX:
+                raise ValueError(f"Share index must be between 0 and {MAX_SHARE_INDEX}.")
+            xs.append(share[0])
+
+        width: int = max([(share[1].bit_length() + 7) // 8 for share in shares] + [1])
+        values: bytes = b''.join(share[1].to_bytes(width, 'big') for share in shares)
+        return cls(xs, values, width)
+
+    def value_bytes(self, index: int) -> memoryview:
+        """
+        Return a zero-copy view of the fixed width bytes of one share value.
+
+        Arguments:
+            index (int): The position of the share in the set.
+
+        Returns:
+            memoryview: The big-endian bytes of the share value.
+        """
+        if index < 0:
+            index += len(self.xs)
+        if not 0 <= index < len(self.xs):
+            raise IndexError("ShareSet index out of range")
+        return self._values[index * self.width:(index + 1) * self.width]
+
+    def to_list(self) -> List[Tuple[int, int]]:
+        """
+        Convert the share set to the legacy list of (index, value) tuples.
+
+        Returns:
+            List[Tuple[int, int]]: The shares as a list of tuples.
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        """
+        Return the number of shares in the set.
+
+        Returns:
+            int: The number of shares.
+        """
+        return len(self.xs)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[int, int], 'ShareSet']:
+        """
+        Return one share as an (index, value) tuple, or a slice of the set as a new share set.
+
+        Contiguous slices share the underlying value buffer rather than copying it.
+
+        Arguments:
+            index (Union[int, slice]): The position of the share, or a slice of positions.
+
+        Returns:
+            Union[Tuple[int, int], ShareSet]: The share, or the sliced share set.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.xs))
+            if step == 1:
+                return ShareSet(self.xs[start:stop], self._values[start * self.width:max(start, stop) * self.width], self.width)
+            positions: range = range(start, stop, step)
+            return ShareSet(array('H', (self.xs[i] for i in positions)), b''.join(self.value_bytes(i) for i in positions), self.width)
+
+        return self.xs[index], int.from_bytes(self.value_bytes(index), 'big')
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the shares as (index, value) tuples.
+
+        Returns:
+            Iterator[Tuple[int, int]]: The shares.
+        """
+        for i, x in enumerate(self.xs):
+            yield x, int.from_bytes(self._values[i * self.width:(i + 1) * self.width], 'big')
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the shares with another share set or list of shares.
+
+        Arguments:
+            other (object): The share set or list to compare against.
+
+        Returns:
+            bool: True if both hold the same shares in the same order.
+        """
+        if isinstance(other, (ShareSet, list)):
+            return list(self) == [tuple(share) for share in other]
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """
+        Return a short description of the share set.
+
+        Returns:
+            str: The description.
+        """
+        return f"ShareSet(shares={len(self.xs)}, width={self.width})"
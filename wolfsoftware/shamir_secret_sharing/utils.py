@@ -5,13 +5,16 @@ This module provides helper functions for converting between data types, reading
 and writing shares to files.
 """
 
+import base64
 import os
 import sys
 
-from typing import Optional
+from typing import List, Optional, Union
 
 from wolfsoftware.notify import error_message
 
+from .constants import VERIFIABLE_SHARE_MARKER, MAX_DECIMAL_SHARE_BITS
+
 
 def string_to_bytes(s: str) -> bytes:
     """
@@ -94,6 +97,75 @@ def int_to_string(n: int, original_length: int) -> str:
     return bytes_to_string(b)
 
 
+def _field_to_string(field: Union[int, str, bytes]) -> str:
+    """
+    Convert a single share field to text.
+
+    Arguments:
+        field (Union[int, str, bytes]): The share field.
+
+    Returns:
+        str: The field as text.
+    """
+    if isinstance(field, bytes):
+        return base64.b64encode(field).decode('ascii')
+    if isinstance(field, int) and field.bit_length() > MAX_DECIMAL_SHARE_BITS:
+        return hex(field)
+    return str(field)
+
+
+def _string_to_int(field: str) -> int:
+    """
+    Convert an integer share field, written in decimal or as 0x prefixed hex, back to an integer.
+
+    Arguments:
+        field (str): The field as text.
+
+    Returns:
+        int: The integer value.
+    """
+    if field.startswith('0x'):
+        return int(field, 16)
+    return int(field)
+
+
+def share_to_string(share: tuple) -> str:
+    """
+    Convert a share to its comma separated text form.
+
+    Integer fields are written in decimal, or in 0x prefixed hex once they are wider than MAX_DECIMAL_SHARE_BITS, and
+    the payload of dispersal shares is written in base64.
+
+    Arguments:
+        share (tuple): The share to convert.
+
+    Returns:
+        str: The share as text.
+    """
+    return ','.join(_field_to_string(field) for field in share)
+
+
+def string_to_share(s: str) -> tuple:
+    """
+    Convert the comma separated text form of a share back into a tuple.
+
+    Shamir shares have two integer fields, optionally followed by the threshold, and verifiable shares add a trailing
+    marker. Dispersal shares have four or more fields, the fourth of which is the base64 encoded payload.
+
+    Arguments:
+        s (str): The share as text.
+
+    Returns:
+        tuple: The share as a tuple.
+    """
+    fields: list = s.strip().split(',')
+    if len(fields) == 4 and fields[3] == VERIFIABLE_SHARE_MARKER:
+        return tuple(map(_string_to_int, fields[:3])) + (fields[3],)
+    if len(fields) < 4:
+        return tuple(map(_string_to_int, fields))
+    return tuple(map(_string_to_int, fields[:3])) + (base64.b64decode(fields[3]),) + tuple(map(_string_to_int, fields[4:]))
+
+
 def read_secret_from_file(file_path: str) -> str:
     """
     Read a secret from a file.
@@ -114,20 +186,59 @@ def read_secret_from_file(file_path: str) -> str:
 
 def read_share_from_file(file_path: str) -> tuple:
     """
-    Read a share from a file and convert it to a tuple of integers.
+    Read a share from a file and convert it to a tuple.
 
     Arguments:
         file_path (str): The path to the file containing the share.
 
     Returns:
-        tuple: The share read from the file as a tuple of integers.
+        tuple: The share read from the file as a tuple of integers, plus the payload for dispersal shares.
     """
     if not os.path.exists(file_path):
         print(error_message(f"The file {file_path} does not exist."))
         sys.exit(1)
 
     with open(file_path, 'r', encoding='UTF-8') as file:
-        return tuple(map(int, file.read().strip().split(',')))
+        return string_to_share(file.read())
+
+
+def read_commitments_from_file(file_path: str) -> List[int]:
+    """
+    Read Feldman commitments from a file.
+
+    Arguments:
+        file_path (str): The path to the file containing the commitments.
+
+    Returns:
+        List[int]: The commitments read from the file.
+    """
+    if not os.path.exists(file_path):
+        print(error_message(f"The file {file_path} does not exist."))
+        sys.exit(1)
+
+    with open(file_path, 'r', encoding='UTF-8') as file:
+        return [int(field) for field in file.read().strip().split(',')]
+
+
+def write_commitments_to_file(commitments: List[int], output: bool, directory: Optional[str] = None) -> None:
+    """
+    Write Feldman commitments to a file or print them to the output.
+
+    Arguments:
+        commitments (List[int]): The commitments to write.
+        output (bool): Whether to print the commitments to the output.
+        directory (Optional[str]): The directory to write the commitments to. If None, they are written to the current directory.
+    """
+    text: str = ','.join(map(str, commitments))
+    if output:
+        print(f'Commitments: {text}')
+    else:
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        commitments_file: str = os.path.join(directory, 'commitments.txt') if directory else 'commitments.txt'
+        with open(commitments_file, 'w', encoding='UTF-8') as f:
+            f.write(text)
+        print(f'Commitments written to {commitments_file}')
 
 
 def write_shares_to_files(shares: list, output: bool, directory: Optional[str] = None) -> None:
@@ -135,18 +246,18 @@ def write_shares_to_files(shares: list, output: bool, directory: Optional[str] =
     Write shares to files or print them to the output.
 
     Arguments:
-        shares (list): The list of shares to write.
+        shares (list): The list of shares to write, or a ShareSet.
         output (bool): Whether to print the shares to the output.
         directory (Optional[str]): The directory to write the shares to. If None, shares are written to the current directory.
     """
     if output:
         for share in shares:
-            print(f'Share: {share[0]},{share[1]}')
+            print(f'Share: {share_to_string(share)}')
     else:
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
         for i, share in enumerate(shares, 1):
             share_file: str = os.path.join(directory, f'share-{i}.txt') if directory else f'share-{i}.txt'
             with open(share_file, 'w', encoding='UTF-8') as f:
-                f.write(f'{share[0]},{share[1]}')
+                f.write(share_to_string(share))
             print(f'Share {i} written to {share_file}')
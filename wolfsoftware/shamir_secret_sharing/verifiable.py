@@ -0,0 +1,220 @@
+"""
+Functions for Feldman verifiable secret sharing.
+
+When shares are created in verifiable mode the dealer also publishes commitments C_j = g**a_j to the polynomial
+coefficients, in the prime-order subgroup of the RFC 3526 2048-bit group. The sharing polynomial works modulo that order,
+with coefficients drawn uniformly from it, so a custodian holding the share (x, y) can check on their own that
+g**y == prod(C_j ** (x**j)) without the commitments revealing the other coefficients. The commitment C_0 = g**secret is
+still a deterministic function of the secret, so a guessable secret can be confirmed by trying candidates against it.
+
+Every check needs g raised to a large exponent, so powers of the fixed generator are served from a windowed
+precomputation table. The commitment side is evaluated with Horner's rule using the small share index as the exponent,
+which keeps the cost of checking a share close to a single exponentiation. Many shares are checked together by taking
+a random linear combination, which needs only threshold + 1 exponentiations for the whole batch.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .constants import FELDMAN_PRIME, FELDMAN_GENERATOR, FELDMAN_ORDER
+from .randomness import RandomnessProvider, get_default_provider
+
+DEFAULT_WINDOW_BITS = 4  # Exponent bits handled by each row of a fixed-base table
+BATCH_CHALLENGE_BITS = 128  # Size of the random multipliers used for batch verification
+
+
+class FixedBaseTable:  # pylint: disable=too-few-public-methods  # a lookup table with a single operation, pow
+    """
+    Precomputed powers of a fixed base for fast exponentiation.
+
+    Row i holds base ** (d * 2 ** (window_bits * i)) for every digit d, so raising the base to any exponent below
+    2 ** exponent_bits takes one multiplication per window and no squarings.
+
+    Arguments:
+        base (int): The fixed base.
+        modulus (int): The modulus of the group.
+        exponent_bits (int): The largest exponent size, in bits, that the table supports.
+        window_bits (int): The number of exponent bits handled by each row.
+    """
+
+    __slots__ = ('modulus', 'window_bits', 'rows')
+
+    def __init__(self, base: int, modulus: int, exponent_bits: int, window_bits: int = DEFAULT_WINDOW_BITS) -> None:
+        """
+        Build the table of powers of the base.
+
+        Arguments:
+            base (int): The fixed base.
+            modulus (int): The modulus of the group.
+            exponent_bits (int): The largest exponent size, in bits, that the table supports.
+            window_bits (int): The number of exponent bits handled by each row.
+        """
+        self.modulus: int = modulus
+        self.window_bits: int = window_bits
+        self.rows: List[List[int]] = []
+
+        row_base: int = base % modulus
+        for _ in range((exponent_bits + window_bits - 1) // window_bits):
+            row: List[int] = [1]
+            for _ in range((1 << window_bits) - 1):
+                row.append(row[-1] * row_base % modulus)
+            self.rows.append(row)
+            row_base = row[-1] * row_base % modulus
+
+    def pow(self, exponent: int) -> int:
+        """
+        Raise the base to the given exponent.
+
+        Arguments:
+            exponent (int): The non-negative exponent, which must fit in the table.
+
+        Returns:
+            int: The base raised to the exponent, modulo the modulus.
+        """
+        if exponent.bit_length() > len(self.rows) * self.window_bits:
+            raise ValueError("Exponent is too large for this table.")
+
+        mask: int = (1 << self.window_bits) - 1
+        result = 1
+        for row in self.rows:
+            if not exponent:
+                break
+            digit: int = exponent & mask
+            if digit:
+                result = result * row[digit] % self.modulus
+            exponent >>= self.window_bits
+        return result
+
+
+@lru_cache(maxsize=None)
+def generator_table() -> FixedBaseTable:
+    """
+    Return the shared fixed-base table for the commitment generator, building it on first use.
+
+    Returns:
+        FixedBaseTable: The table of powers of the generator.
+    """
+    return FixedBaseTable(FELDMAN_GENERATOR, FELDMAN_PRIME, FELDMAN_ORDER.bit_length())
+
+
+def create_commitments(coefficients: list) -> List[int]:
+    """
+    Create Feldman commitments to the coefficients of a sharing polynomial.
+
+    Arguments:
+        coefficients (list): The coefficients of the polynomial, as returned by generate_coefficients.
+
+    Returns:
+        List[int]: One commitment per coefficient.
+    """
+    table: FixedBaseTable = generator_table()
+    return [table.pow(coefficient % FELDMAN_ORDER) for coefficient in coefficients]
+
+
+def validate_commitments(commitments: list) -> None:
+    """
+    Check that every commitment is an element of the order FELDMAN_ORDER subgroup.
+
+    The checks reduce exponents modulo FELDMAN_ORDER, which is only sound inside that subgroup, so a commitment outside
+    it (such as -C mod p) could make good shares fail or let the batch check pass a bad share half the time.
+
+    Arguments:
+        commitments (list): The commitments to the polynomial coefficients.
+    """
+    if not commitments:
+        raise ValueError("At least one commitment is required.")
+    for j, commitment in enumerate(commitments):
+        if not 1 < commitment < FELDMAN_PRIME or pow(commitment, FELDMAN_ORDER, FELDMAN_PRIME) != 1:
+            raise ValueError(f"Commitment {j} is not an element of the commitment group.")
+
+
+def _evaluate_commitments(x: int, commitments: list) -> int:
+    """
+    Evaluate prod(C_j ** (x**j)) with Horner's rule, so every exponentiation uses the small share index.
+
+    Arguments:
+        x (int): The share index.
+        commitments (list): The commitments to the polynomial coefficients.
+
+    Returns:
+        int: The commitment to the polynomial value at x.
+    """
+    x %= FELDMAN_ORDER
+    result = 1
+    for commitment in reversed(commitments):
+        result = pow(result, x, FELDMAN_PRIME) * commitment % FELDMAN_PRIME
+    return result
+
+
+def _verify_share(share: tuple, commitments: list) -> bool:
+    """
+    Check a single share against commitments that have already been validated.
+
+    Arguments:
+        share (tuple): The share, a tuple containing the share index and value.
+        commitments (list): The validated commitments to the polynomial coefficients.
+
+    Returns:
+        bool: True if the share is consistent with the commitments.
+    """
+    x, y = share[0], share[1]
+    return generator_table().pow(y % FELDMAN_ORDER) == _evaluate_commitments(x, commitments)
+
+
+def verify_share(share: tuple, commitments: list) -> bool:
+    """
+    Check a single share against the published commitments.
+
+    Arguments:
+        share (tuple): The share, a tuple containing the share index and value.
+        commitments (list): The commitments to the polynomial coefficients.
+
+    Returns:
+        bool: True if the share is consistent with the commitments.
+    """
+    validate_commitments(commitments)
+    return _verify_share(share, commitments)
+
+
+def verify_share_commitments(shares: list, commitments: list, provider: Optional[RandomnessProvider] = None) -> Tuple[bool, List[int]]:
+    """
+    Check many shares against the published commitments with a single batched test.
+
+    Each share is given a random multiplier r_i and the test g ** sum(r_i * y_i) == prod(C_j ** sum(r_i * x_i**j))
+    is made once for the whole batch. A batch containing a bad share passes with probability about 2 ** -128. Only
+    when the batch fails are the shares checked one at a time to find the offenders. The commitments are validated
+    once up front, and a ValueError is raised if any of them lies outside the commitment group.
+
+    Arguments:
+        shares (list): The list of shares, each a tuple containing the share index and value.
+        commitments (list): The commitments to the polynomial coefficients.
+        provider (Optional[RandomnessProvider]): The source of the random multipliers. If None, the default provider is used.
+
+    Returns:
+        Tuple[bool, List[int]]: Whether every share is valid, and the x-values of the invalid shares.
+    """
+    validate_commitments(commitments)
+
+    shares = list(shares)
+    if provider is None:
+        provider = get_default_provider()
+    multipliers: List[int] = provider.randbelow_many(1 << BATCH_CHALLENGE_BITS, len(shares))
+
+    combined_value = 0
+    combined_exponents: List[int] = [0] * len(commitments)
+    for r, share in zip(multipliers, shares):
+        x, y = share[0], share[1]
+        combined_value += r * y
+        power: int = r
+        for j in range(len(commitments)):
+            combined_exponents[j] = (combined_exponents[j] + power) % FELDMAN_ORDER
+            power = power * x % FELDMAN_ORDER
+
+    expected = 1
+    for commitment, exponent in zip(commitments, combined_exponents):
+        expected = expected * pow(commitment, exponent, FELDMAN_PRIME) % FELDMAN_PRIME
+
+    if generator_table().pow(combined_value % FELDMAN_ORDER) == expected:
+        return True, []
+
+    return False, [share[0] for share in shares if not _verify_share(share, commitments)]